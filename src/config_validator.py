@@ -31,6 +31,38 @@ class RunnerType(str, Enum):
     PIPOWER = "pipower"
 
 
+class INA219Calibration(str, Enum):
+    """Valid INA219 calibration presets (adafruit_ina219 set_calibration_*)."""
+
+    CAL_32V_2A = "32V_2A"
+    CAL_32V_1A = "32V_1A"
+    CAL_16V_400MA = "16V_400mA"
+    CAL_16V_5A = "16V_5A"
+
+
+class INA219ADCResolution(str, Enum):
+    """Valid INA219 ADC resolution/averaging settings (ADCResolution.ADCRES_*)."""
+
+    RES_9BIT_1S = "9BIT_1S"
+    RES_10BIT_1S = "10BIT_1S"
+    RES_11BIT_1S = "11BIT_1S"
+    RES_12BIT_1S = "12BIT_1S"
+    RES_12BIT_2S = "12BIT_2S"
+    RES_12BIT_4S = "12BIT_4S"
+    RES_12BIT_8S = "12BIT_8S"
+    RES_12BIT_16S = "12BIT_16S"
+    RES_12BIT_32S = "12BIT_32S"
+    RES_12BIT_64S = "12BIT_64S"
+    RES_12BIT_128S = "12BIT_128S"
+
+
+class INA219BusVoltageRange(str, Enum):
+    """Valid INA219 bus voltage ranges (BusVoltageRange.RANGE_*)."""
+
+    RANGE_16V = "16V"
+    RANGE_32V = "32V"
+
+
 @dataclass
 class ValidationError:
     """Represents a validation error with context."""
@@ -243,6 +275,30 @@ class ConfigValidator:
                     )
                 )
 
+        # Optional ADC settings, applied once when the hardware is initialized
+        choices = (
+            ("calibration", INA219Calibration),
+            ("adc_resolution", INA219ADCResolution),
+            ("bus_voltage_range", INA219BusVoltageRange),
+        )
+        for field, enum_type in choices:
+            if field not in config:
+                continue
+            # A null bus voltage range keeps the calibration preset's range
+            if field == "bus_voltage_range" and config[field] is None:
+                continue
+            try:
+                enum_type(config[field])
+            except ValueError:
+                self.errors.append(
+                    ValidationError(
+                        f"runners.{runner_name}.{field}",
+                        f"Invalid {field.replace('_', ' ')}",
+                        value=str(config[field]),
+                        expected=f"one of: {[choice.value for choice in enum_type]}",
+                    )
+                )
+
     def _validate_pipower_config(
         self, runner_name: str, config: Dict[str, Any]
     ) -> None:
@@ -279,6 +335,51 @@ class ConfigValidator:
                         )
                     )
 
+        # Optional tuning keys; the monitor uses them as given when present
+        positive_fields = ["adc_vref", "adc_max", "bt_lv_divider", "health_ttl_s"]
+        for field in positive_fields:
+            if field in config:
+                self._validate_positive_number(
+                    f"runners.{runner_name}.{field}", config[field]
+                )
+
+        if "use_pigpio" in config and not isinstance(config["use_pigpio"], bool):
+            self.errors.append(
+                ValidationError(
+                    f"runners.{runner_name}.use_pigpio",
+                    "Must be a boolean",
+                    value=type(config["use_pigpio"]).__name__,
+                    expected="boolean",
+                )
+            )
+
+        # Optional background sampling; a null interval leaves it off
+        if config.get("sample_interval_s") is not None:
+            self._validate_positive_number(
+                f"runners.{runner_name}.sample_interval_s", config["sample_interval_s"]
+            )
+
+    def _validate_positive_number(self, path: str, value: Any) -> None:
+        """Record an error unless value is a positive int or float."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            self.errors.append(
+                ValidationError(
+                    path,
+                    "Must be a number",
+                    value=type(value).__name__,
+                    expected="positive number",
+                )
+            )
+        elif value <= 0:
+            self.errors.append(
+                ValidationError(
+                    path,
+                    "Must be positive",
+                    value=value,
+                    expected="positive number",
+                )
+            )
+
     def _validate_application_config(self, app_config: Dict[str, Any]) -> None:
         """
         Validate application configuration.
@@ -11,7 +11,7 @@ import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class RunnerState(Enum):
@@ -24,10 +24,21 @@ class RunnerState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RunnerStatus:
     """Status information for a runner."""
 
+    __slots__ = (
+        "name",
+        "state",
+        "enabled",
+        "healthy",
+        "error_count",
+        "last_error",
+        "uptime",
+        "last_activity",
+    )
+
     name: str
     state: RunnerState
     enabled: bool
@@ -77,6 +88,10 @@ class BaseRunner(abc.ABC):
         self._start_time: Optional[float] = None
         self._last_activity: Optional[float] = None
 
+        # Health change notification
+        self._health_listeners: List[Callable[[str, bool], None]] = []
+        self._last_healthy: Optional[bool] = None
+
         # Configuration
         self.interval = self._get_config_value("measurement_interval", 1.0)
         # NEW: Behavior and trigger configuration for runners
@@ -121,6 +136,19 @@ class BaseRunner(abc.ABC):
             f"Runner '{self.name}' {'enabled' if enabled else 'disabled'}"
         )
 
+    def add_health_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """
+        Register a callback for health changes.
+
+        The callback is invoked from the runner thread with the runner name
+        and the new health state whenever is_healthy() changes between work
+        cycles.
+
+        Args:
+            listener: Function taking (runner_name, healthy)
+        """
+        self._health_listeners.append(listener)
+
     def start(self) -> bool:
         """
         Start the runner thread.
@@ -242,22 +270,9 @@ class BaseRunner(abc.ABC):
                         break
                     continue  # Skip work cycle if conditions not met
 
-                try:
-                    # Update activity timestamp
-                    self._last_activity = time.time()
-
-                    # Run the main work cycle
-                    self._work_cycle()
-
-                    # Wait for next cycle or stop signal
-                    if self._stop_event.wait(self.interval):
-                        break  # Stop requested
-
-                except Exception as e:
-                    self._record_error(f"Error in work cycle: {e}")
-                    # Continue running unless it's a critical error
-                    if not self._handle_error(e):
-                        break
+                # Wait for next cycle or stop signal; failed cycles retry at once
+                if self._run_cycle() and self._stop_event.wait(self.interval):
+                    break  # Stop requested
 
         except Exception as e:
             self._record_error(f"Fatal error in runner thread: {e}")
@@ -269,6 +284,52 @@ class BaseRunner(abc.ABC):
             except Exception as e:
                 self.logger.error(f"Error during cleanup: {e}")
 
+    def _run_cycle(self) -> bool:
+        """
+        Run one work cycle and re-evaluate health.
+
+        The runner thread calls this once per interval. It can also be called
+        directly to step a runner without starting its thread.
+
+        Returns:
+            True if the cycle succeeded, False if it raised. The error is
+            recorded, and the stop event is set if _handle_error() says so.
+        """
+        try:
+            # Update activity timestamp
+            self._last_activity = time.time()
+
+            # Run the main work cycle
+            self._work_cycle()
+        except Exception as e:
+            self._record_error(f"Error in work cycle: {e}")
+            self._update_health()
+            # Continue running unless it's a critical error
+            if not self._handle_error(e):
+                self._stop_event.set()
+            return False
+
+        self._update_health()
+        return True
+
+    def _update_health(self) -> None:
+        """Re-evaluate health and notify listeners if it changed."""
+        try:
+            healthy = self.is_healthy()
+        except Exception as e:
+            self.logger.error(f"Error checking health of runner '{self.name}': {e}")
+            healthy = False
+
+        if healthy == self._last_healthy:
+            return
+        self._last_healthy = healthy
+
+        for listener in self._health_listeners:
+            try:
+                listener(self.name, healthy)
+            except Exception as e:
+                self.logger.error(f"Error in health listener: {e}")
+
     def _record_error(self, error_msg: str) -> None:
         """Record an error for status tracking."""
         self._error_count += 1
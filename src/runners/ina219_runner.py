@@ -16,10 +16,19 @@ from sensors.ina219_power_monitor import PowerReading, SensorReadError
 from .base_runner import BaseRunner
 
 
-@dataclass
+@dataclass(frozen=True)
 class PowerStats:
     """Statistics for power readings over time."""
 
+    __slots__ = (
+        "avg_voltage",
+        "avg_current",
+        "avg_power",
+        "min_power",
+        "max_power",
+        "sample_count",
+    )
+
     avg_voltage: float
     avg_current: float
     avg_power: float
@@ -58,6 +67,10 @@ class INA219Runner(BaseRunner):
         ina219_config = {
             "ina219": {
                 "i2c_address": self.i2c_address,
+                "i2c_bus": config.get("i2c_bus", 1),
+                "calibration": config.get("calibration", "32V_2A"),
+                "adc_resolution": config.get("adc_resolution", "12BIT_1S"),
+                "bus_voltage_range": config.get("bus_voltage_range"),
                 "measurement_interval": config.get("measurement_interval", 1.0),
                 "log_measurements": config.get("log_measurements", True),
                 "low_power_threshold": config.get("low_power_threshold", 0.5),
@@ -5,22 +5,145 @@ This module provides a threaded runner for monitoring the PiPower V2 UPS.
 It continuously monitors battery status, power input, and charging state.
 """
 
+import threading
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import py_trees
 
 from sensors.pipower_monitor import PiPowerMonitor, PiPowerReading, SensorReadError
 
 from .base_runner import BaseRunner
 
+# PiPowerReading attributes reported in status dictionaries
+_READING_FIELDS = (
+    "battery_voltage",
+    "is_usb_power_input",
+    "is_charging",
+    "is_low_battery",
+    "timestamp",
+)
 
-@dataclass
+
+def _reading_to_dict(reading: PiPowerReading) -> Dict[str, Any]:
+    """Convert a PiPowerReading into a status dictionary."""
+    return {field: getattr(reading, field) for field in _READING_FIELDS}
+
+
+# Encoding of Optional[bool] status flags in the history buffer
+_FLAG_UNKNOWN = -1
+_FLAG_VALUES = {None: _FLAG_UNKNOWN, False: 0, True: 1}
+_FLAG_DECODE = {_FLAG_UNKNOWN: None, 0: False, 1: True}
+
+
+class _ReadingRing:
+    """
+    Fixed-size history of PiPower readings stored in NumPy arrays.
+
+    Each reading field lives in a preallocated array indexed by a moving
+    head, so keeping history allocates no per-reading objects and the
+    statistics are computed with array reductions. Missing voltages are
+    stored as NaN and missing flags as -1.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.voltages = np.full(capacity, np.nan, dtype=np.float64)
+        self.usb = np.full(capacity, _FLAG_UNKNOWN, dtype=np.int8)
+        self.charging = np.full(capacity, _FLAG_UNKNOWN, dtype=np.int8)
+        self.low = np.full(capacity, _FLAG_UNKNOWN, dtype=np.int8)
+        self.timestamps = np.zeros(capacity, dtype=np.int64)  # monotonic ns
+        self.head = 0  # Index the next reading is written to
+        self.filled = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.filled
+
+    def push(self, reading: PiPowerReading) -> None:
+        """Store a reading, overwriting the oldest one when full."""
+        voltage = reading.battery_voltage
+        with self._lock:
+            i = self.head
+            self.voltages[i] = np.nan if voltage is None else voltage
+            self.usb[i] = _FLAG_VALUES[reading.is_usb_power_input]
+            self.charging[i] = _FLAG_VALUES[reading.is_charging]
+            self.low[i] = _FLAG_VALUES[reading.is_low_battery]
+            self.timestamps[i] = reading.timestamp
+            self.head = (i + 1) % self.capacity
+            if self.filled < self.capacity:
+                self.filled += 1
+
+    def snapshot(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Copy the stored readings out, oldest first.
+
+        Returns:
+            Tuple of (voltages, usb, charging, low, timestamps) arrays
+        """
+        with self._lock:
+            if self.filled < self.capacity:
+                order = np.arange(self.filled)
+            else:
+                order = np.roll(np.arange(self.capacity), -self.head)
+            return (
+                self.voltages[order],
+                self.usb[order],
+                self.charging[order],
+                self.low[order],
+                self.timestamps[order],
+            )
+
+    def readings(self, count: Optional[int] = None) -> List[PiPowerReading]:
+        """
+        Rebuild PiPowerReading objects for the stored history.
+
+        Args:
+            count: Maximum number of most recent readings to return
+
+        Returns:
+            List of readings, oldest first
+        """
+        voltages, usb, charging, low, timestamps = self.snapshot()
+        if count is not None:
+            voltages, usb, charging, low, timestamps = (
+                voltages[-count:],
+                usb[-count:],
+                charging[-count:],
+                low[-count:],
+                timestamps[-count:],
+            )
+
+        return [
+            PiPowerReading(
+                battery_voltage=None if np.isnan(v) else float(v),
+                is_usb_power_input=_FLAG_DECODE[int(u)],
+                is_charging=_FLAG_DECODE[int(c)],
+                is_low_battery=_FLAG_DECODE[int(lo)],
+                timestamp=int(t),
+            )
+            for v, u, c, lo, t in zip(voltages, usb, charging, low, timestamps)
+        ]
+
+
+@dataclass(frozen=True)
 class PowerStats:
     """Statistics for power readings over time."""
 
+    __slots__ = (
+        "avg_battery_voltage",
+        "min_battery_voltage",
+        "max_battery_voltage",
+        "usb_power_percent",
+        "charging_percent",
+        "low_battery_percent",
+        "sample_count",
+    )
+
     avg_battery_voltage: Optional[float]
     min_battery_voltage: Optional[float]
     max_battery_voltage: Optional[float]
@@ -56,7 +179,7 @@ class PiPowerRunner(BaseRunner):
 
         # Statistics tracking
         self.max_history_size = 100  # Keep last 100 readings for stats
-        self._reading_history: deque = deque(maxlen=self.max_history_size)
+        self._reading_history = _ReadingRing(self.max_history_size)
         self._last_reading: Optional[PiPowerReading] = None
 
         # Alert tracking
@@ -136,7 +259,7 @@ class PiPowerRunner(BaseRunner):
             # Take a power reading
             reading = self.power_monitor.get_reading()
             self._last_reading = reading
-            self._reading_history.append(reading)
+            self._reading_history.push(reading)
 
             # Check conditions and generate alerts
             self._check_power_alerts(reading)
@@ -204,7 +327,7 @@ class PiPowerRunner(BaseRunner):
             return False
 
         # Check if last reading is recent (within 2x the interval)
-        time_since_last = time.time() - self._last_reading.timestamp
+        time_since_last = (time.monotonic_ns() - self._last_reading.timestamp) / 1e9
         if time_since_last > (self.interval * 2):
             return False
 
@@ -225,22 +348,19 @@ class PiPowerRunner(BaseRunner):
         if not self._reading_history:
             return None
 
-        readings = list(self._reading_history)
-        voltages = [
-            r.battery_voltage for r in readings if r.battery_voltage is not None
-        ]
-        usb_power_count = sum(1 for r in readings if r.is_usb_power_input)
-        charging_count = sum(1 for r in readings if r.is_charging)
-        low_battery_count = sum(1 for r in readings if r.is_low_battery)
+        voltages, usb, charging, low, _ = self._reading_history.snapshot()
+        sample_count = len(usb)
+        valid_voltages = voltages[~np.isnan(voltages)]
+        has_voltage = valid_voltages.size > 0
 
         return PowerStats(
-            avg_battery_voltage=sum(voltages) / len(voltages) if voltages else None,
-            min_battery_voltage=min(voltages) if voltages else None,
-            max_battery_voltage=max(voltages) if voltages else None,
-            usb_power_percent=(usb_power_count / len(readings)) * 100,
-            charging_percent=(charging_count / len(readings)) * 100,
-            low_battery_percent=(low_battery_count / len(readings)) * 100,
-            sample_count=len(readings),
+            avg_battery_voltage=float(valid_voltages.mean()) if has_voltage else None,
+            min_battery_voltage=float(valid_voltages.min()) if has_voltage else None,
+            max_battery_voltage=float(valid_voltages.max()) if has_voltage else None,
+            usb_power_percent=(np.count_nonzero(usb == 1) / sample_count) * 100,
+            charging_percent=(np.count_nonzero(charging == 1) / sample_count) * 100,
+            low_battery_percent=(np.count_nonzero(low == 1) / sample_count) * 100,
+            sample_count=sample_count,
         )
 
     def get_reading_history(self, count: Optional[int] = None) -> List[PiPowerReading]:
@@ -253,10 +373,7 @@ class PiPowerRunner(BaseRunner):
         Returns:
             List of PiPowerReading objects
         """
-        readings = list(self._reading_history)
-        if count is not None:
-            readings = readings[-count:]
-        return readings
+        return self._reading_history.readings(count)
 
     def _cleanup(self) -> None:
         """Cleanup PiPower-specific resources."""
@@ -316,13 +433,7 @@ class PiPowerRunner(BaseRunner):
 
         # Add last reading info
         if self._last_reading:
-            enhanced["last_reading"] = {
-                "battery_voltage": self._last_reading.battery_voltage,
-                "is_usb_power_input": self._last_reading.is_usb_power_input,
-                "is_charging": self._last_reading.is_charging,
-                "is_low_battery": self._last_reading.is_low_battery,
-                "timestamp": self._last_reading.timestamp,
-            }
+            enhanced["last_reading"] = _reading_to_dict(self._last_reading)
 
         # Add power statistics
         if stats:
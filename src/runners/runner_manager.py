@@ -5,22 +5,60 @@ This module provides central management for all threaded runners.
 It handles startup, shutdown, monitoring, and status reporting for all runners.
 """
 
+import importlib
 import logging
+import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Set, Type
 
-from .audio_runner import AudioRunner
-from .base_runner import BaseRunner, RunnerStatus
-from .ina219_runner import INA219Runner
-from .pipower_runner import PiPowerRunner
-from .webcam_runner import WebcamRunner
+from .base_runner import BaseRunner, RunnerState, RunnerStatus
 
+# Status report indicators, indexed by a boolean
+_STATE_GLYPHS = ("○", "●")  # not running, running
+_HEALTH_GLYPHS = ("⚠", "✓")  # unhealthy, healthy
 
-@dataclass
+
+def _runner_importer(
+    module_name: str, class_name: str
+) -> Callable[[], Type[BaseRunner]]:
+    """
+    Build a function that imports a runner class on first use.
+
+    Runner modules pull in hardware and media libraries (numpy, cv2,
+    sounddevice, ...), so they are only imported for runner types that
+    are actually configured.
+
+    Args:
+        module_name: Runner module name relative to this package
+        class_name: Name of the runner class inside that module
+
+    Returns:
+        Function returning the runner class
+    """
+
+    def _import() -> Type[BaseRunner]:
+        module = importlib.import_module(f".{module_name}", __package__)
+        return getattr(module, class_name)
+
+    return _import
+
+
+@dataclass(frozen=True)
 class SystemStatus:
     """Overall system status for all runners."""
 
+    __slots__ = (
+        "total_runners",
+        "running_runners",
+        "stopped_runners",
+        "error_runners",
+        "healthy_runners",
+        "uptime",
+        "last_status_check",
+    )
+
     total_runners: int
     running_runners: int
     stopped_runners: int
@@ -58,18 +96,24 @@ class RunnerManager:
         # Runner registry
         self._runners: Dict[str, BaseRunner] = {}
 
-        # Runner type registry - maps runner types to their classes
-        self._runner_classes: Dict[str, Type[BaseRunner]] = {
-            "ina219": INA219Runner,
-            "pipower": PiPowerRunner,
-            "webcam": WebcamRunner,
-            "audio": AudioRunner,
+        # Runners that last reported themselves unhealthy
+        self._unhealthy: Set[str] = set()
+        self._health_lock = threading.Lock()
+
+        # Runner type registry - maps runner types to functions that import
+        # their classes, so unused runner modules are never loaded
+        self._runner_importers: Dict[str, Callable[[], Type[BaseRunner]]] = {
+            "ina219": _runner_importer("ina219_runner", "INA219Runner"),
+            "pipower": _runner_importer("pipower_runner", "PiPowerRunner"),
+            "webcam": _runner_importer("webcam_runner", "WebcamRunner"),
+            "audio": _runner_importer("audio_runner", "AudioRunner"),
             # Add more runner classes here as they are developed
         }
+        self._resolved_classes: Dict[str, Type[BaseRunner]] = {}
 
         # Manager state
         self._running = False
-        self._shutdown_requested = False
+        self._shutdown_event = threading.Event()
         self._start_time: Optional[float] = None
 
         # Configuration
@@ -91,42 +135,60 @@ class RunnerManager:
         Returns:
             True if registered successfully, False otherwise
         """
-        success = False
+        logger = self.logger
 
         # Early validation checks
         if not self.threaded_runners_enabled:
-            self.logger.info(f"Threaded runners disabled, skipping {runner_id}")
-        elif runner_id in self._runners:
-            self.logger.warning(f"Runner '{runner_id}' already registered")
-        else:
-            # Get runner type from config
-            runner_type = runner_config.get("type")
-            if not runner_type:
-                self.logger.error(f"Runner type not specified for '{runner_id}'")
-            elif runner_type not in self._runner_classes:
-                self.logger.error(
-                    f"Unknown runner type '{runner_type}' for '{runner_id}'"
-                )
-            else:
-                try:
-                    runner_class = self._runner_classes[runner_type]
-                    runner = runner_class(runner_id, runner_config, self.production)
-
-                    if not runner.enabled:
-                        self.logger.warning(
-                            f"Runner '{runner_id}' is disabled in configuration"
-                        )
-                    else:
-                        self._runners[runner_id] = runner
-                        self.logger.debug(
-                            f"Registered runner: {runner_id} ({runner_type})"
-                        )
-                        success = True
-
-                except Exception as e:
-                    self.logger.error(f"Failed to register runner '{runner_id}': {e}")
+            logger.info(f"Threaded runners disabled, skipping {runner_id}")
+            return False
+        if runner_id in self._runners:
+            logger.warning(f"Runner '{runner_id}' already registered")
+            return False
 
-        return success
+        # Get runner type from config
+        runner_type = runner_config.get("type")
+        if not runner_type:
+            logger.error(f"Runner type not specified for '{runner_id}'")
+            return False
+
+        try:
+            runner_class = self._get_runner_class(runner_type)
+            if runner_class is None:
+                logger.error(f"Unknown runner type '{runner_type}' for '{runner_id}'")
+                return False
+
+            runner = runner_class(runner_id, runner_config, self.production)
+        except Exception as e:
+            logger.error(f"Failed to register runner '{runner_id}': {e}")
+            return False
+
+        if not runner.enabled:
+            logger.warning(f"Runner '{runner_id}' is disabled in configuration")
+            return False
+
+        runner.add_health_listener(self._on_runner_health_change)
+        self._runners[runner_id] = runner
+        logger.debug(f"Registered runner: {runner_id} ({runner_type})")
+        return True
+
+    def _get_runner_class(self, runner_type: str) -> Optional[Type[BaseRunner]]:
+        """
+        Get the runner class for a type, importing its module on first use.
+
+        Args:
+            runner_type: Runner type key from configuration
+
+        Returns:
+            Runner class for the type, or None if the type is unknown
+        """
+        runner_class = self._resolved_classes.get(runner_type)
+        if runner_class is None:
+            importer = self._runner_importers.get(runner_type)
+            if importer is None:
+                return None
+            runner_class = importer()
+            self._resolved_classes[runner_type] = runner_class
+        return runner_class
 
     def _auto_register_runners(self) -> None:
         """Automatically register runners based on configuration."""
@@ -230,10 +292,11 @@ class RunnerManager:
 
     def shutdown(self) -> None:
         """Initiate graceful shutdown of the runner manager."""
-        if self._shutdown_requested:
+        if self._shutdown_event.is_set():
             return
 
-        self._shutdown_requested = True
+        # Setting the event wakes the main loop immediately
+        self._shutdown_event.set()
         self.logger.info("Shutting down runner manager...")
 
         # Stop all runners
@@ -255,28 +318,39 @@ class RunnerManager:
         try:
             self.logger.info("Runner manager main loop started")
 
-            while self._running and not self._shutdown_requested:
+            while self._running and not self._shutdown_event.is_set():
                 # Perform periodic health checks and maintenance
                 self._health_check_cycle()
 
-                # Sleep until next cycle
-                time.sleep(self.main_loop_interval)
+                # Sleep until next cycle, returning early if shutdown is requested
+                if self._shutdown_event.wait(self.main_loop_interval):
+                    break
 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
         except Exception as e:
             self.logger.error(f"Error in runner manager main loop: {e}")
         finally:
-            if not self._shutdown_requested:
+            if not self._shutdown_event.is_set():
                 self.shutdown()
 
+    def _on_runner_health_change(self, runner_id: str, healthy: bool) -> None:
+        """Track health changes pushed by runners."""
+        with self._health_lock:
+            if healthy:
+                self._unhealthy.discard(runner_id)
+            else:
+                self._unhealthy.add(runner_id)
+
     def _health_check_cycle(self) -> None:
-        """Perform periodic health checks on all runners."""
-        unhealthy_runners = []
+        """Report runners that have pushed an unhealthy state."""
+        if not self._unhealthy:
+            return
 
-        for name, runner in self._runners.items():
-            if runner.is_running and not runner.is_healthy():
-                unhealthy_runners.append(name)
+        with self._health_lock:
+            unhealthy_runners = [
+                name for name in self._unhealthy if self._runners[name].is_running
+            ]
 
         if unhealthy_runners:
             self.logger.warning(f"Unhealthy runners detected: {unhealthy_runners}")
@@ -350,27 +424,28 @@ class RunnerManager:
         system_status = self.get_system_status()
         runner_statuses = self.get_all_runner_statuses()
 
-        print("\n" + "=" * 60)
-        print("SOLAR Robot Runner Manager Status Report")
-        print("=" * 60)
-
-        print(f"System Uptime: {system_status.uptime:.1f}s")
-        print(f"Total Runners: {system_status.total_runners}")
-        print(
+        # Build the whole report first so it goes out in a single write
+        lines = [
+            "",
+            "=" * 60,
+            "SOLAR Robot Runner Manager Status Report",
+            "=" * 60,
+            f"System Uptime: {system_status.uptime:.1f}s",
+            f"Total Runners: {system_status.total_runners}",
             f"Running: {system_status.running_runners}, "
             f"Stopped: {system_status.stopped_runners}, "
-            f"Error: {system_status.error_runners}"
-        )
-        print(f"Healthy: {system_status.healthy_runners}/{system_status.total_runners}")
-
-        print("\nRunner Details:")
-        print("-" * 60)
+            f"Error: {system_status.error_runners}",
+            f"Healthy: {system_status.healthy_runners}/{system_status.total_runners}",
+            "",
+            "Runner Details:",
+            "-" * 60,
+        ]
 
         for name, status in runner_statuses.items():
-            health_indicator = "✓" if status.healthy else "⚠"
-            state_indicator = "●" if status.state.value == "running" else "○"
+            health_indicator = _HEALTH_GLYPHS[status.healthy]
+            state_indicator = _STATE_GLYPHS[status.state is RunnerState.RUNNING]
 
-            print(
+            lines.append(
                 f"{state_indicator} {health_indicator} {name:<15} "
                 f"State: {status.state.value:<8} "
                 f"Uptime: {status.uptime:.1f}s "
@@ -378,9 +453,13 @@ class RunnerManager:
             )
 
             if status.last_error:
-                print(f"    Last Error: {status.last_error}")
+                lines.append(f"    Last Error: {status.last_error}")
+
+        lines.append("=" * 60)
+        lines.append("")
 
-        print("=" * 60)
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     @property
     def is_running(self) -> bool:
@@ -5,7 +5,7 @@ This module provides a threaded runner for the WebcamSensor.
 It periodically captures images and saves them to disk.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from sensors.webcam_sensor import (
     ImageReading,
@@ -41,8 +41,15 @@ class WebcamRunner(BaseRunner):
 
         super().__init__(runner_id, config, production)
 
+        # Webcam-specific configuration, read once since it doesn't change
+        self._max_errors = self._get_config_value("max_errors", 3)
+        self._output_directory = self.webcam_config.get(
+            "output_directory", "data/photos"
+        )
+
         self.sensor: Optional[WebcamSensor] = None
         self._last_capture_details: Optional[ImageReading] = None
+        self._last_capture_shape: Optional[Tuple[int, ...]] = None
 
     def _initialize(self) -> bool:
         """Initialize the WebcamSensor."""
@@ -52,12 +59,15 @@ class WebcamRunner(BaseRunner):
             self.logger.info(
                 f"{self.label} initialized successfully. Capturing images every {self.interval}s."
             )
-            # Perform a test capture
-            test_capture = self.sensor.capture_and_save_photo()
+            # The sensor's writer thread saves photos off the runner thread so
+            # that slow disk writes don't stretch the capture interval
+            self.sensor.on_save_error = self._on_save_error
+            # Perform a test capture, saved synchronously to surface errors
+            test_capture = self.sensor.capture_and_save_photo(wait=True)
             self.logger.debug(
                 f"{self.label} test capture successful: {test_capture.file_path}"
             )
-            self._last_capture_details = test_capture
+            self._set_last_capture(test_capture)
             return True
         except (SensorConfigError, SensorCaptureError) as e:
             self.logger.error(f"Failed to initialize {self.label}: {e}")
@@ -73,7 +83,7 @@ class WebcamRunner(BaseRunner):
 
         try:
             capture_details = self.sensor.capture_and_save_photo()
-            self._last_capture_details = capture_details
+            self._set_last_capture(capture_details)
             self.logger.debug(
                 f"{self.label} captured photo: {capture_details.file_path}"
             )
@@ -83,9 +93,21 @@ class WebcamRunner(BaseRunner):
             # For now, re-raise to allow BaseRunner to handle error counting/stopping
             raise
 
+    def _set_last_capture(self, capture_details: ImageReading) -> None:
+        """Store the latest capture and cache its image shape for status reports."""
+        self._last_capture_details = capture_details
+        self._last_capture_shape = (
+            capture_details.image.shape if capture_details.image is not None else None
+        )
+
+    def _on_save_error(self, error: Exception) -> None:
+        """Record errors from a background photo save."""
+        self._record_error(f"Error saving photo: {error}")
+
     def _cleanup(self) -> None:
         """Cleanup WebcamSensor resources."""
         if self.sensor:
+            # Waits for pending saves before the camera is released
             self.sensor.release()
             self.logger.info(f"{self.label} sensor released.")
         self.sensor = None
@@ -97,7 +119,7 @@ class WebcamRunner(BaseRunner):
             return False
 
         # Check error count
-        if self._error_count >= self._get_config_value("max_errors", 3):
+        if self._error_count >= self._max_errors:
             return False
 
         # Check sensor
@@ -108,8 +130,13 @@ class WebcamRunner(BaseRunner):
         if not sensor_healthy:
             self.logger.warning(f"{self.label} sensor reported as unhealthy.")
         return sensor_healthy
+
+    def get_enhanced_status(self) -> Dict[str, Any]:
         """
         Get enhanced status information including last capture details.
+
+        Returns:
+            Dictionary with comprehensive status information
         """
         base_status = self.get_status()
         sensor_status = self.sensor.get_status() if self.sensor else None
@@ -118,9 +145,7 @@ class WebcamRunner(BaseRunner):
             "base_status": base_status,
             "label": self.label,
             "sensor_status": sensor_status,
-            "output_directory": self.webcam_config.get(
-                "output_directory", "data/photos"
-            ),
+            "output_directory": self._output_directory,
             "capture_interval": self.interval,
         }
 
@@ -128,11 +153,7 @@ class WebcamRunner(BaseRunner):
             enhanced["last_capture"] = {
                 "file_path": self._last_capture_details.file_path,
                 "timestamp": self._last_capture_details.timestamp,
-                "image_shape": (
-                    self._last_capture_details.image.shape
-                    if self._last_capture_details.image is not None
-                    else None
-                ),
+                "image_shape": self._last_capture_shape,
             }
         else:
             enhanced["last_capture"] = None
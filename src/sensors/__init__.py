@@ -14,6 +14,19 @@ Exports:
     - SensorReadError: Exception for sensor read failures
 """
 
-from .ina219_power_monitor import INA219PowerMonitor, PowerReading, SensorReadError
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ina219_power_monitor import INA219PowerMonitor, PowerReading, SensorReadError
 
 __all__ = ["INA219PowerMonitor", "PowerReading", "SensorReadError"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the exports on first access, so importing a sibling module such
+    # as sensors.pipower_monitor doesn't also load the INA219 module
+    if name in __all__:
+        from . import ina219_power_monitor
+
+        return getattr(ina219_power_monitor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
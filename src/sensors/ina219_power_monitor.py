@@ -12,12 +12,46 @@ Features:
 - Configurable thresholds and alerts
 """
 
-import abc  # Added for Abstract Base Class
+import json
 import logging
-import random  # Moved import for use in SimulatedINA219Adapter
+import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# INA219 register addresses
+_REG_BUSVOLTAGE = 0x02
+_REG_POWER = 0x03
+_REG_CURRENT = 0x04
+_REG_CALIBRATION = 0x05
+
+_LOGGER = logging.getLogger(__name__)
+
+# busio.I2C on the board's SCL/SDA pins, shared by every hardware adapter
+_I2C_BUS: Any = None
+_I2C_BUS_LOCK = threading.Lock()
+
+
+def _get_i2c_bus() -> Any:
+    """
+    Return the shared I2C bus, importing Blinka and opening it on first use.
+
+    Returns:
+        busio.I2C instance for the board's default SCL/SDA pins
+    Raises:
+        ImportError if board or busio is not installed.
+    """
+    global _I2C_BUS
+    with _I2C_BUS_LOCK:
+        if _I2C_BUS is None:
+            import board
+            import busio
+
+            _I2C_BUS = busio.I2C(board.SCL, board.SDA)
+        return _I2C_BUS
 
 
 # Custom Exception for sensor reading errors
@@ -27,63 +61,124 @@ class SensorReadError(IOError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PowerReading:
     """Data class for power measurement results."""
 
+    __slots__ = ("voltage", "current", "power", "timestamp")
+
     voltage: float  # Volts
     current: float  # Amperes
     power: float  # Watts
     timestamp: float  # Unix timestamp
 
 
-# Abstract Base Class for Power Sensor Adapters
-class PowerSensorAdapter(abc.ABC):
-    """Abstract base class for power sensor adapters."""
+# Row layout of INA219PowerMonitor.get_readings()
+READING_DTYPE = np.dtype(
+    [
+        ("voltage", np.float64),
+        ("current", np.float64),
+        ("power", np.float64),
+        ("timestamp", np.float64),
+    ]
+)
+
+
+# Base class for Power Sensor Adapters
+class PowerSensorAdapter:
+    """
+    Base class for power sensor adapters.
+
+    Subclasses must override the stub methods. This is a plain class
+    rather than an abc.ABC so constructing adapters skips ABCMeta checks.
+    """
 
-    @abc.abstractmethod
     def read_voltage(self) -> float:
         """Read bus voltage in volts."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def read_current_ma(self) -> float:
         """Read current in milliamperes."""
-        pass
+        raise NotImplementedError
 
     # Power reading from sensor might be direct, or calculated.
     # INA219 provides it directly.
-    @abc.abstractmethod
     def read_power_mw(self) -> float:
         """Read power in milliwatts."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def initialize(self) -> None:
         """Initialize the sensor hardware or simulation."""
-        pass
+        raise NotImplementedError
+
+    def read_all(self) -> Tuple[float, float, float]:
+        """
+        Read voltage, current and power together.
+
+        Adapters that can fetch all three values more cheaply than three
+        separate reads should override this.
+
+        Returns:
+            Tuple of (voltage in V, current in A, power in W)
+        """
+        voltage = self.read_voltage()
+        current_ma = self.read_current_ma()
+        power_mw = self.read_power_mw()
+        return voltage, current_ma / 1000.0, power_mw / 1000.0
+
+    def read_many(self, count: int) -> np.ndarray:
+        """
+        Take several readings at once.
+
+        Adapters that can produce a batch without a Python call per sample
+        should override this.
+
+        Args:
+            count: Number of readings to take
+
+        Returns:
+            Array of shape (count, 3) with columns voltage (V), current (A)
+            and power (W)
+        """
+        readings = np.empty((count, 3))
+        for row in range(count):
+            readings[row] = self.read_all()
+        return readings
 
 
 # Concrete Adapter for the real INA219 hardware
 class HardwareINA219Adapter(PowerSensorAdapter):
     """Adapter for the Adafruit INA219 hardware sensor."""
 
-    def __init__(self, i2c_address: int):
+    def __init__(
+        self,
+        i2c_address: int,
+        i2c_bus: int = 1,
+        calibration: str = "32V_2A",
+        adc_resolution: str = "12BIT_1S",
+        bus_voltage_range: Optional[str] = None,
+    ):
         self.i2c_address = i2c_address
-        self.sensor = None
-        self.logger = logging.getLogger(__name__)
+        self.i2c_bus = i2c_bus
+        self.calibration = calibration
+        self.adc_resolution = adc_resolution
+        self.bus_voltage_range = bus_voltage_range
+        self._i2c_address_str = f"0x{i2c_address:02X}"
+        self.sensor: Optional[Any] = None  # adafruit_ina219.INA219
+        self._smbus: Any = None  # smbus2.SMBus for direct register reads
+        self.logger = _LOGGER
         self._initialize_sensor()
 
     def _initialize_sensor(self) -> None:
         try:
-            import board
-            import busio
             from adafruit_ina219 import INA219  # type: ignore
 
-            i2c = busio.I2C(board.SCL, board.SDA)
-            self.sensor = INA219(i2c, addr=self.i2c_address)
+            self.sensor = INA219(_get_i2c_bus(), addr=self.i2c_address)
+            self._configure_adc()
+            self._smbus = self._open_smbus()
             self.logger.info(
-                f"Hardware INA219 sensor initialized at address 0x{self.i2c_address:02X}"
+                "Hardware INA219 sensor initialized at address %s",
+                self._i2c_address_str,
             )
         except ImportError:
             self.logger.error(
@@ -97,6 +192,46 @@ class HardwareINA219Adapter(PowerSensorAdapter):
             self.logger.error(f"Failed to initialize INA219 hardware: {e}")
             raise SensorReadError(f"Failed to initialize INA219 hardware: {e}") from e
 
+    def _configure_adc(self) -> None:
+        """
+        Apply the calibration preset and ADC settings once, at initialization.
+
+        Each ADC conversion takes longer the more samples it averages, so
+        the resolution directly bounds how fast fresh readings are available.
+        Calibration presets rewrite the config register, so they go first.
+        """
+        from adafruit_ina219 import ADCResolution, BusVoltageRange  # type: ignore
+
+        sensor = self.sensor
+        if sensor is None:
+            raise SensorReadError("INA219 sensor not available.")
+        getattr(sensor, f"set_calibration_{self.calibration}")()
+        resolution = getattr(ADCResolution, f"ADCRES_{self.adc_resolution}")
+        sensor.bus_adc_resolution = resolution
+        sensor.shunt_adc_resolution = resolution
+        if self.bus_voltage_range is not None:
+            sensor.bus_voltage_range = getattr(
+                BusVoltageRange, f"RANGE_{self.bus_voltage_range}"
+            )
+
+    def _open_smbus(self) -> Any:
+        """
+        Open the I2C bus through smbus2 for direct register reads.
+
+        Returns:
+            An smbus2.SMBus, or None if smbus2 or the bus device is unavailable,
+            in which case reads go through the Adafruit driver's I2C device.
+        """
+        try:
+            from smbus2 import SMBus  # type: ignore
+
+            return SMBus(self.i2c_bus)
+        except (ImportError, OSError) as e:
+            self.logger.debug(
+                "smbus2 unavailable for /dev/i2c-%d, using busio: %s", self.i2c_bus, e
+            )
+            return None
+
     def initialize(self) -> None:
         # Initialization is done in __init__ for this adapter
         if not self.sensor:  # Try to re-initialize if it failed previously
@@ -133,20 +268,109 @@ class HardwareINA219Adapter(PowerSensorAdapter):
             self.logger.error(f"Error reading power from hardware: {e}")
             raise SensorReadError(f"Error reading power from hardware: {e}") from e
 
+    def read_all(self) -> Tuple[float, float, float]:
+        """
+        Read voltage, current and power in a single pass over the registers.
+
+        The driver properties each lock the bus and issue their own register
+        read, so this reads the three registers directly and applies the
+        same scaling as the driver. With smbus2 each register is one SMBus
+        word transfer, a single ioctl during which the GIL is released;
+        otherwise the reads share one locked busio transaction.
+
+        Returns:
+            Tuple of (voltage in V, current in A, power in W)
+        Raises:
+            SensorReadError if the bus transaction fails.
+        """
+        if not self.sensor:
+            raise SensorReadError("INA219 sensor not available.")
+        sensor = self.sensor
+        try:
+            if self._smbus is not None:
+                raw_voltage, raw_current, raw_power = self._read_registers_smbus()
+            else:
+                raw_voltage, raw_current, raw_power = self._read_registers_busio()
+        except Exception as e:
+            self.logger.error(f"Error reading INA219 registers: {e}")
+            raise SensorReadError(f"Error reading INA219 registers: {e}") from e
+
+        if raw_current > 0x7FFF:  # CURRENT is a signed register
+            raw_current -= 0x10000
+
+        voltage = (raw_voltage >> 3) * 0.004  # 4mV per bit, low 3 bits are flags
+        current_ma = raw_current * sensor._current_lsb
+        power_mw = raw_power * sensor._power_lsb  # Same scaling as read_power_mw
+        return voltage, current_ma / 1000.0, power_mw / 1000.0
+
+    def _read_registers_busio(self) -> Tuple[int, int, int]:
+        """Read the raw BUSVOLTAGE, CURRENT and POWER registers through busio."""
+        sensor = self.sensor
+        if sensor is None:
+            raise SensorReadError("INA219 sensor not available.")
+        cal_value = sensor._cal_value
+        with sensor.i2c_device as i2c:
+            # The chip loses its calibration on a brown-out, and CURRENT and
+            # POWER read as zero without it, so rewrite it first like the
+            # driver does
+            i2c.write(bytes([_REG_CALIBRATION, cal_value >> 8, cal_value & 0xFF]))
+            return (
+                self._read_register(i2c, _REG_BUSVOLTAGE),
+                self._read_register(i2c, _REG_CURRENT),
+                self._read_register(i2c, _REG_POWER),
+            )
+
+    def _read_registers_smbus(self) -> Tuple[int, int, int]:
+        """Read the raw BUSVOLTAGE, CURRENT and POWER registers through smbus2."""
+        sensor = self.sensor
+        if sensor is None:
+            raise SensorReadError("INA219 sensor not available.")
+        bus = self._smbus
+        address = self.i2c_address
+        swap = self._swap_bytes
+        bus.write_word_data(address, _REG_CALIBRATION, swap(sensor._cal_value))
+        return (
+            swap(bus.read_word_data(address, _REG_BUSVOLTAGE)),
+            swap(bus.read_word_data(address, _REG_CURRENT)),
+            swap(bus.read_word_data(address, _REG_POWER)),
+        )
+
+    @staticmethod
+    def _swap_bytes(word: int) -> int:
+        """Convert between SMBus little-endian words and INA219 big-endian."""
+        return ((word & 0xFF) << 8) | (word >> 8)
+
+    @staticmethod
+    def _read_register(i2c: Any, register: int) -> int:
+        """Read a 16-bit big-endian register from an already locked device."""
+        buffer = bytearray(2)
+        i2c.write_then_readinto(bytes([register]), buffer)
+        return (buffer[0] << 8) | buffer[1]
+
 
 # Concrete Adapter for Simulated Sensor
 class SimulatedINA219Adapter(PowerSensorAdapter):
     """Adapter for a simulated INA219 sensor."""
 
+    # Simulated ranges as (low, span), sampled as low + span * random()
+    _VOLTAGE_RANGE = (11.7, 0.6)  # 12V nominal +/- 0.3V
+    _NORMAL_CURRENT_MA = (200.0, 600.0)  # 200-800mA
+    # 800-1200mA, occasionally triggers high power warnings but not too often
+    _HIGH_CURRENT_MA = (800.0, 400.0)
+    _STATE_DURATION_S = (30.0, 90.0)  # 30s to 2min between state changes
+
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
+        # Private generator with a pre-bound method for the per-reading hot path
+        self._rng = random.Random()
+        self._random = self._rng.random
+        self._np_rng = np.random.default_rng()  # For batched readings
         self.initialize()
         # Add state to occasionally simulate higher power draws
         self._normal_operation = True
-        self._last_state_change = time.time()
-        self._state_duration = random.uniform(
-            30, 120
-        )  # 30s to 2min between state changes
+        self._last_state_change = time.monotonic()
+        low, span = self._STATE_DURATION_S
+        self._state_duration = low + span * self._random()
 
     def initialize(self) -> None:
         self.logger.debug("Simulated INA219 sensor initialized.")
@@ -154,37 +378,76 @@ class SimulatedINA219Adapter(PowerSensorAdapter):
 
     def _update_operation_state(self) -> None:
         """Update whether we're in normal or high power operation mode."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_state_change > self._state_duration:
             # 90% chance of normal operation, 10% chance of high power
-            self._normal_operation = random.random() < 0.9
+            self._normal_operation = self._random() < 0.9
             self._last_state_change = current_time
-            self._state_duration = random.uniform(30, 120)
+            low, span = self._STATE_DURATION_S
+            self._state_duration = low + span * self._random()
 
     def read_voltage(self) -> float:
         # Simulate typical solar/battery voltage (12V nominal with some variation)
-        base_voltage = 12.0
-        variation = random.uniform(-0.3, 0.3)  # Reduced variation
-        return max(0.0, base_voltage + variation)
+        low, span = self._VOLTAGE_RANGE
+        return low + span * self._random()
 
     def read_current_ma(self) -> float:
         self._update_operation_state()
+        return self._sample_current_ma()
 
+    def _sample_current_ma(self) -> float:
         if self._normal_operation:
-            # Normal operation: 200-800mA (0.2-0.8A)
-            current = random.uniform(200.0, 800.0)
+            low, span = self._NORMAL_CURRENT_MA
         else:
-            # High power operation: 800-1200mA (0.8-1.2A)
-            # This will occasionally trigger high power warnings but not too frequently
-            current = random.uniform(800.0, 1200.0)
-
-        return current
+            low, span = self._HIGH_CURRENT_MA
+        return low + span * self._random()
 
     def read_power_mw(self) -> float:
-        # Calculate simulated power from voltage and current
-        voltage_v = self.read_voltage()
-        current_ma = self.read_current_ma()
-        return voltage_v * current_ma  # V * mA = mW
+        return self.read_all()[2] * 1000.0
+
+    def read_all(self) -> Tuple[float, float, float]:
+        # Sample voltage and current once and derive power from them, so a
+        # reading is internally consistent. This is the per-sample hot path,
+        # so it inlines _update_operation_state(), read_voltage() and
+        # _sample_current_ma() rather than paying for three method calls.
+        rand = self._random
+        now = time.monotonic()
+        if now - self._last_state_change > self._state_duration:
+            self._normal_operation = rand() < 0.9
+            self._last_state_change = now
+            low, span = self._STATE_DURATION_S
+            self._state_duration = low + span * rand()
+
+        low, span = self._VOLTAGE_RANGE
+        voltage_v = low + span * rand()
+        if self._normal_operation:
+            low, span = self._NORMAL_CURRENT_MA
+        else:
+            low, span = self._HIGH_CURRENT_MA
+        current_a = (low + span * rand()) / 1000.0
+        return voltage_v, current_a, voltage_v * current_a
+
+    def read_many(self, count: int) -> np.ndarray:
+        # Draw the whole batch in two vectorized calls. The operating state
+        # is updated once, so a batch never straddles a state change.
+        self._update_operation_state()
+        if self._normal_operation:
+            current_low, current_span = self._NORMAL_CURRENT_MA
+        else:
+            current_low, current_span = self._HIGH_CURRENT_MA
+        voltage_low, voltage_span = self._VOLTAGE_RANGE
+
+        readings = np.empty((count, 3))
+        voltage = readings[:, 0]
+        current = readings[:, 1]
+        voltage[:] = self._np_rng.uniform(
+            voltage_low, voltage_low + voltage_span, count
+        )
+        current[:] = self._np_rng.uniform(
+            current_low / 1000.0, (current_low + current_span) / 1000.0, count
+        )
+        np.multiply(voltage, current, out=readings[:, 2])
+        return readings
 
 
 class INA219PowerMonitor:
@@ -204,22 +467,41 @@ class INA219PowerMonitor:
         """
         self.config = config.get("ina219", {})
         self.production = production
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
 
         # Configuration parameters
         self.i2c_address = self.config.get("i2c_address", 0x40)
+        self._i2c_address_str = f"0x{self.i2c_address:02X}"
         self.measurement_interval = self.config.get("measurement_interval", 1.0)
         self.log_measurements = self.config.get("log_measurements", True)
         self.low_power_threshold = self.config.get("low_power_threshold", 0.5)
         self.high_power_threshold = self.config.get("high_power_threshold", 10.0)
+        self._thresholds = (self.low_power_threshold, self.high_power_threshold)
+
+        # get_status() fields that never change, copied into each status dict.
+        # The nested thresholds dict is shared between calls.
+        self._static_status: Dict[str, Any] = {
+            "sensor_type": "INA219",
+            "i2c_address": self._i2c_address_str,
+            "mode": "production" if production else "development",
+            "thresholds": {
+                "low_power": self.low_power_threshold,
+                "high_power": self.high_power_threshold,
+            },
+        }
 
         # Initialize sensor adapter
         self.sensor_adapter: PowerSensorAdapter
         self._last_reading: Optional[PowerReading] = None
+        self._last_reading_time = 0.0  # time.monotonic() of the last reading
+        # (healthy, time.monotonic() deadline) refreshed by every reading
+        self._health_cache: Tuple[bool, float] = (False, 0.0)
+        # (healthy, serialized status) cleared by every new reading
+        self._status_json: Optional[Tuple[bool, bytes]] = None
         self._init_sensor_adapter()
 
         self.logger.debug(
-            f"INA219 Power Monitor initialized - Address: 0x{self.i2c_address:02X}, "
+            f"INA219 Power Monitor initialized - Address: {self._i2c_address_str}, "
             f"Mode: {'Production' if production else 'Development'}"
         )
 
@@ -227,10 +509,23 @@ class INA219PowerMonitor:
         """Initialize the appropriate sensor adapter based on environment."""
         try:
             if self.production:
-                self.sensor_adapter = HardwareINA219Adapter(self.i2c_address)
+                self.sensor_adapter = HardwareINA219Adapter(
+                    self.i2c_address,
+                    self.config.get("i2c_bus", 1),
+                    calibration=self.config.get("calibration", "32V_2A"),
+                    adc_resolution=self.config.get("adc_resolution", "12BIT_1S"),
+                    bus_voltage_range=self.config.get("bus_voltage_range"),
+                )
             else:
                 self.sensor_adapter = SimulatedINA219Adapter()
             self.sensor_adapter.initialize()  # Ensure it's ready
+            # Bind the adapter's read methods once so each read skips the
+            # sensor_adapter attribute lookup
+            self._read_voltage = self.sensor_adapter.read_voltage
+            self._read_current_ma = self.sensor_adapter.read_current_ma
+            self._read_power_mw = self.sensor_adapter.read_power_mw
+            self._read_all = self.sensor_adapter.read_all
+            self._read_many = self.sensor_adapter.read_many
         except SensorReadError as e:  # Catch errors from adapter initialization
             self.logger.error(f"Failed to initialize INA219 sensor adapter: {e}")
             # If production sensor fails, we might want to fall back or raise
@@ -252,7 +547,7 @@ class INA219PowerMonitor:
             SensorReadError if reading fails.
         """
         try:
-            return self.sensor_adapter.read_voltage()
+            return self._read_voltage()
         except SensorReadError as e:
             self.logger.error(f"Error reading voltage: {e}")
             raise  # Re-raise the specific error
@@ -267,7 +562,7 @@ class INA219PowerMonitor:
             SensorReadError if reading fails.
         """
         try:
-            current_ma = self.sensor_adapter.read_current_ma()
+            current_ma = self._read_current_ma()
             return current_ma / 1000.0  # Convert mA to A
         except SensorReadError as e:
             self.logger.error(f"Error reading current: {e}")
@@ -283,25 +578,36 @@ class INA219PowerMonitor:
             SensorReadError if reading fails.
         """
         try:
-            power_mw = self.sensor_adapter.read_power_mw()
+            power_mw = self._read_power_mw()
             return power_mw / 1000.0  # Convert mW to W
         except SensorReadError as e:
             self.logger.error(f"Error reading power: {e}")
             raise
 
-    def get_reading(self) -> PowerReading:
+    def get_reading(self, force: bool = False) -> PowerReading:
         """
         Get a complete power reading with voltage, current, and power.
 
+        A reading taken less than one measurement interval ago is returned
+        again instead of reading the sensor.
+
+        Args:
+            force: Read the sensor even if the last reading is still fresh
+
         Returns:
             PowerReading object with all measurements
         Raises:
             SensorReadError if any underlying sensor read fails.
         """
+        if (
+            not force
+            and self._last_reading is not None
+            and time.monotonic() - self._last_reading_time < self.measurement_interval
+        ):
+            return self._last_reading
+
         try:
-            voltage = self.read_voltage()
-            current = self.read_current()
-            power = self.read_power()
+            voltage, current, power = self._read_all()
             timestamp = time.time()
 
             reading = PowerReading(
@@ -309,31 +615,80 @@ class INA219PowerMonitor:
             )
 
             self._last_reading = reading
+            self._last_reading_time = now = time.monotonic()
+            self._status_json = None
 
-            if self.log_measurements:
+            # Skip building the message entirely when debug logging is off
+            if self.log_measurements and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Power Reading - V: {voltage:.2f}V, I: {current:.3f}A, P: {power:.2f}W"
+                    "Power Reading - V: %.2fV, I: %.3fA, P: %.2fW",
+                    voltage,
+                    current,
+                    power,
                 )
 
             # Check thresholds
             self._check_thresholds(reading)
 
+            # Health falls out of every reading for free
+            self._health_cache = (
+                self._evaluate_health(reading),
+                now + self.measurement_interval,
+            )
+
             return reading
         except SensorReadError as e:
             self.logger.error(f"Failed to get complete power reading: {e}")
             raise  # Propagate the error
 
+    def get_readings(self, count: int) -> np.ndarray:
+        """
+        Take a batch of readings as a single structured array.
+
+        Intended for replay and analysis, where building one PowerReading
+        per sample is the bottleneck. Unlike get_reading(), this does not
+        update the last reading or check thresholds.
+
+        Args:
+            count: Number of readings to take
+
+        Returns:
+            Structured array of READING_DTYPE with one row per reading; every
+            row carries the timestamp at which the batch was taken
+        Raises:
+            SensorReadError if any underlying sensor read fails.
+        """
+        try:
+            values = self._read_many(count)
+        except SensorReadError as e:
+            self.logger.error(f"Error getting power readings: {e}")
+            raise
+
+        readings = np.empty(count, dtype=READING_DTYPE)
+        readings["voltage"] = values[:, 0]
+        readings["current"] = values[:, 1]
+        readings["power"] = values[:, 2]
+        readings["timestamp"] = time.time()
+        return readings
+
     def _check_thresholds(self, reading: PowerReading) -> None:
         """Check power reading against configured thresholds."""
-        if reading.power < self.low_power_threshold:
+        low_power_threshold, high_power_threshold = self._thresholds
+        power = reading.power
+        if low_power_threshold <= power <= high_power_threshold:
+            return  # Common case: within range, nothing to log
+
+        if power < low_power_threshold:
             self.logger.warning(
-                f"Low power detected: {reading.power:.2f}W "
-                f"(threshold: {self.low_power_threshold}W)"
+                "Low power detected: %.2fW (threshold: %sW)",
+                power,
+                low_power_threshold,
             )
-        elif reading.power > self.high_power_threshold:
+        else:
             self.logger.warning(
-                f"High power detected: {reading.power:.2f}W "
-                f"(threshold: {self.high_power_threshold}W)"
+                "High power detected: %.2fW (threshold: %sW)",
+                power,
+                high_power_threshold,
             )
 
     def get_last_reading(self) -> Optional[PowerReading]:
@@ -349,9 +704,18 @@ class INA219PowerMonitor:
         """
         Check if the sensor is responding and providing reasonable readings.
 
+        The verdict from the last reading is returned as is for one
+        measurement interval. After that the last reading is re-evaluated if
+        it is younger than twice the measurement interval; otherwise a fresh
+        reading is taken.
+
         Returns:
             True if sensor appears healthy, False otherwise
         """
+        healthy, expires_at = self._health_cache
+        if time.monotonic() < expires_at:
+            return healthy
+
         health_status = False  # Default to unhealthy
         try:
             # Attempt to initialize the adapter if it's not ready (e.g., if initial attempt failed)
@@ -377,28 +741,20 @@ class INA219PowerMonitor:
                     )
                     return health_status
 
-            reading = (
-                self.get_reading()
-            )  # This will raise SensorReadError if issues occur
-
-            # Basic sanity checks - all conditions must be met for healthy status
-            health_status = (
-                -0.1
-                < reading.voltage
-                < 30  # Allow slightly below 0 for noise, but not much
-                and -5.0 < reading.current < 5.0  # Reasonable current limit (A)
-                and -1.0
-                < reading.power
-                < 150.0  # Reasonable power limit (W), allow slightly negative
-            )
+            # Only touch the sensor if the last reading is missing or stale
+            reading = self._last_reading
+            if reading is None or (
+                time.monotonic() - self._last_reading_time
+                > 2 * self.measurement_interval
+            ):
+                # This will raise SensorReadError if issues occur
+                reading = self.get_reading()
 
-            if not health_status:
-                if not (-0.1 < reading.voltage < 30):
-                    self.logger.warning(f"Unhealthy voltage: {reading.voltage}V")
-                if not (-5.0 < reading.current < 5.0):
-                    self.logger.warning(f"Unhealthy current: {reading.current}A")
-                if not (-1.0 < reading.power < 150.0):
-                    self.logger.warning(f"Unhealthy power: {reading.power}W")
+            health_status = self._evaluate_health(reading)
+            self._health_cache = (
+                health_status,
+                time.monotonic() + self.measurement_interval,
+            )
 
         except SensorReadError as e:
             self.logger.error(f"Health check failed due to sensor read error: {e}")
@@ -407,6 +763,37 @@ class INA219PowerMonitor:
 
         return health_status
 
+    def _evaluate_health(self, reading: PowerReading) -> bool:
+        """
+        Check a reading against sane voltage, current and power ranges.
+
+        Args:
+            reading: Reading to validate
+
+        Returns:
+            True if all values are within range, False otherwise
+        """
+        # Basic sanity checks - all conditions must be met for healthy status
+        health_status = (
+            -0.1
+            < reading.voltage
+            < 30  # Allow slightly below 0 for noise, but not much
+            and -5.0 < reading.current < 5.0  # Reasonable current limit (A)
+            and -1.0
+            < reading.power
+            < 150.0  # Reasonable power limit (W), allow slightly negative
+        )
+
+        if not health_status:
+            if not (-0.1 < reading.voltage < 30):
+                self.logger.warning(f"Unhealthy voltage: {reading.voltage}V")
+            if not (-5.0 < reading.current < 5.0):
+                self.logger.warning(f"Unhealthy current: {reading.current}A")
+            if not (-1.0 < reading.power < 150.0):
+                self.logger.warning(f"Unhealthy power: {reading.power}W")
+
+        return health_status
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get comprehensive status information about the power monitor.
@@ -416,17 +803,9 @@ class INA219PowerMonitor:
         """
         reading = self.get_last_reading()
 
-        status = {
-            "sensor_type": "INA219",
-            "i2c_address": f"0x{self.i2c_address:02X}",
-            "mode": "production" if self.production else "development",
-            "healthy": self.is_healthy(),
-            "last_reading": None,
-            "thresholds": {
-                "low_power": self.low_power_threshold,
-                "high_power": self.high_power_threshold,
-            },
-        }
+        status = self._static_status.copy()
+        status["healthy"] = self.is_healthy()
+        status["last_reading"] = None
 
         if reading:
             status["last_reading"] = {
@@ -437,3 +816,23 @@ class INA219PowerMonitor:
             }
 
         return status
+
+    def get_status_json(self) -> bytes:
+        """
+        Get get_status() serialized as compact UTF-8 JSON.
+
+        The bytes are cached until the next reading or a change in health,
+        so endpoints polled between readings skip the serialization.
+
+        Returns:
+            JSON-encoded status information
+        """
+        healthy = self.is_healthy()
+        cached = self._status_json
+        if cached is not None and cached[0] == healthy:
+            return cached[1]
+
+        status = self.get_status()
+        payload = json.dumps(status, separators=(",", ":")).encode()
+        self._status_json = (status["healthy"], payload)
+        return payload
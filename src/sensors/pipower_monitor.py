@@ -12,12 +12,16 @@ Features:
 - Development mode simulation
 """
 
-import abc
 import logging
-import random
+import mmap
+import os
+import struct
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 # Attempt to import RPi.GPIO, but allow failure for non-Pi environments
 try:
@@ -25,6 +29,46 @@ try:
 except (ImportError, RuntimeError):
     import FakeRPi.GPIO as GPIO
 
+# BCM283x GPIO registers, mapped without root through /dev/gpiomem
+_GPIOMEM_PATH = "/dev/gpiomem"
+_GPIOMEM_SIZE = 4096
+_GPLEV0_OFFSET = 0x34  # Pin level register for GPIO 0-31, one bit per pin
+_GPLEV0 = struct.Struct("<I")  # 32-bit little-endian register
+
+# Digital PiPower pins in the order read_status() reports them
+_DIGITAL_PINS = ("IN_DT", "CHG", "LO_DT")
+
+# GPIO character device whose line offsets are the BCM pin numbers
+_GPIOCHIP = "gpiochip0"
+_EDGE_WAIT_S = 1  # How often the edge watcher checks for shutdown
+
+# MCP3008 ADC for BT_LV, on SPI0 CE0
+_SPI_BUS = 0
+_SPI_DEVICE = 0
+_MCP3008_MAX_SPEED_HZ = 1_350_000  # Datasheet maximum at 2.7V
+# pigpio bit-banged SPI for the MCP3008 (use_pigpio), on the SPI0 pins
+_BB_SPI_CS = 8
+_BB_SPI_MISO = 9
+_BB_SPI_MOSI = 10
+_BB_SPI_SCLK = 11
+_BB_SPI_BAUD = 250_000  # pigpio's bit-banged SPI maximum
+# Defaults for the adc_vref, adc_max and bt_lv_divider config keys
+_DEFAULT_ADC_VREF = 3.3  # ADC reference, the Pi's 3.3V rail
+_DEFAULT_ADC_MAX = 1023  # 10-bit full scale
+_DEFAULT_BT_LV_DIVIDER = 3.0  # BT_LV is 1/3 of the battery voltage
+
+# Log text for the digital pin levels, indexed by the level (False, True)
+_USB_STR = ("Low (No USB Power)", "High (USB Power)")
+_CHG_STR = ("Low (Not Charging)", "High (Charging)")
+_LO_DT_STR = ("Low (Normal)", "High (Low Battery)")
+# get_reading() summary text, keyed by the reading's flag (None if unread)
+_USB_SUMMARY = {None: "USB N/A", False: "No USB", True: "USB In"}
+_CHG_SUMMARY = {None: "Charge N/A", False: "Not Charging", True: "Charging"}
+_LO_DT_SUMMARY = {None: "LowBatt N/A", False: "Batt OK", True: "LOW BATT"}
+
+# Random draws the simulator pre-generates per refill
+_SIM_BLOCK_SIZE = 4096
+
 
 # Custom Exception for sensor reading errors
 class SensorReadError(IOError):
@@ -33,42 +77,68 @@ class SensorReadError(IOError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PiPowerReading:
     """Data class for PiPower status."""
 
+    __slots__ = (
+        "battery_voltage",
+        "is_usb_power_input",
+        "is_charging",
+        "is_low_battery",
+        "timestamp",
+    )
+
     battery_voltage: Optional[float]  # Actual battery voltage in Volts
     is_usb_power_input: Optional[bool]
     is_charging: Optional[bool]
     is_low_battery: Optional[bool]
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() when the reading was taken
 
 
-class PiPowerSensorAdapter(abc.ABC):
-    """Abstract base class for PiPower sensor adapters."""
+class PiPowerSensorAdapter:
+    """
+    Base class for PiPower sensor adapters.
+
+    Subclasses must override every method. This is a plain class rather
+    than an abc.ABC, as with the INA219 adapters.
+    """
 
-    @abc.abstractmethod
     def initialize(
         self, pins: Dict[str, int], adc_channel: Optional[int] = None
     ) -> None:
         """Initialize the sensor hardware or simulation."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def read_status(self) -> PiPowerReading:
         """Read the current status from PiPower."""
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def cleanup(self) -> None:
         """Clean up GPIO resources."""
-        pass
+        raise NotImplementedError
 
 
 class HardwarePiPowerAdapter(PiPowerSensorAdapter):
     """Adapter for the PiPower hardware using RPi.GPIO."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        adc_vref: float = _DEFAULT_ADC_VREF,
+        adc_max: int = _DEFAULT_ADC_MAX,
+        bt_lv_divider: float = _DEFAULT_BT_LV_DIVIDER,
+        use_pigpio: bool = False,
+    ):
+        """
+        Initialize the hardware adapter.
+
+        Args:
+            adc_vref: MCP3008 reference voltage in volts
+            adc_max: ADC full-scale count (1023 for the 10-bit MCP3008)
+            bt_lv_divider: Battery voltage divided by the BT_LV pin voltage
+            use_pigpio: Clock the MCP3008 through the pigpio daemon instead
+                of the kernel spidev driver
+        """
         self.logger = logging.getLogger(__name__)
         self.pins: Dict[str, Optional[int]] = {
             "BT_LV": None,  # Analog, requires ADC
@@ -77,6 +147,29 @@ class HardwarePiPowerAdapter(PiPowerSensorAdapter):
             "LO_DT": None,  # Digital
         }
         self.adc_channel: Optional[int] = None  # For BT_LV if using an ADC like MCP3008
+        # IN_DT, CHG and LO_DT pin numbers and their GPLEV0 bit masks, unpacked
+        # from self.pins once (None if not configured)
+        self._digital_pins: Tuple[Optional[int], ...] = (None, None, None)
+        self._pin_masks: Tuple[Optional[int], ...] = (None, None, None)
+        self._gpio_levels: Optional[mmap.mmap] = None  # /dev/gpiomem mapping
+        # Readers chosen once by initialize() for the configured hardware:
+        # the polled IN_DT/CHG/LO_DT source, and the BT_LV ADC if it opened
+        self._read_digital_pins: Callable[
+            [], Tuple[Optional[bool], Optional[bool], Optional[bool]]
+        ] = self._read_digital_pins_gpio
+        self._read_adc_raw: Optional[Callable[[], int]] = None
+        # Edge-driven IN_DT/CHG/LO_DT levels, replaced whole by the watcher
+        self._edge_levels: Optional[Tuple[Optional[bool], ...]] = None
+        self._edge_lines: Any = None  # gpiod.LineBulk with edge events
+        self._edge_thread: Optional[threading.Thread] = None
+        self._edge_stop = threading.Event()
+        self._spi: Any = None  # spidev.SpiDev for the MCP3008
+        self._use_pigpio = use_pigpio
+        self._pigpio: Any = None  # pigpio.pi with bit-banged SPI open
+        self._adc_tx = bytes(3)  # MCP3008 request frame for adc_channel
+        # Raw ADC count to BT_LV pin volts, and straight to battery volts
+        self._adc_volts_per_count = adc_vref / adc_max
+        self._adc_to_battery = adc_vref * bt_lv_divider / adc_max
 
         if GPIO is None:
             self.logger.error(
@@ -141,14 +234,25 @@ class HardwarePiPowerAdapter(PiPowerSensorAdapter):
                 self.logger.info(f"LO_DT pin {self.pins['LO_DT']} setup as input.")
 
             # BT_LV pin setup depends on whether an ADC is used
-            if self.pins["BT_LV"] is not None and self.adc_channel is not None:
-                # Here you would initialize your ADC (e.g., MCP3008)
-                # For example, if using a library for MCP3008:
-                # self.adc = MCP3008(spi_bus, spi_device)
-                self.logger.info(
-                    f"BT_LV will be read from ADC channel {self.adc_channel} "
-                    f"(GPIO pin {self.pins['BT_LV']} might be CE/CS for SPI)."
-                )
+            if self.adc_channel is not None:
+                # Start bit, single-ended mode + channel, then a clock-out byte
+                self._adc_tx = bytes([1, (8 + self.adc_channel) << 4, 0])
+                if self._use_pigpio:
+                    self._pigpio = self._open_pigpio_spi()
+                    if self._pigpio is not None:
+                        self._read_adc_raw = self._read_adc_raw_pigpio
+                        self.logger.info(
+                            f"BT_LV will be read from MCP3008 channel "
+                            f"{self.adc_channel} over pigpio bit-banged SPI."
+                        )
+                else:
+                    self._spi = self._open_spi()
+                    if self._spi is not None:
+                        self._read_adc_raw = self._read_adc_raw_spidev
+                        self.logger.info(
+                            f"BT_LV will be read from MCP3008 channel "
+                            f"{self.adc_channel} on SPI{_SPI_BUS}.{_SPI_DEVICE}."
+                        )
             elif self.pins["BT_LV"] is not None:
                 self.logger.warning(
                     "BT_LV pin specified but no ADC channel provided. "
@@ -160,97 +264,302 @@ class HardwarePiPowerAdapter(PiPowerSensorAdapter):
                     "BT_LV pin/ADC channel not configured. Battery voltage reading will not be available."
                 )
 
+            # Track the digital pins from edge interrupts if possible, or else
+            # read them all with one register load per reading
+            self._digital_pins = tuple(self.pins[name] for name in _DIGITAL_PINS)
+            self._pin_masks = tuple(
+                None if pin is None else 1 << pin for pin in self._digital_pins
+            )
+            if not self._start_edge_watch():
+                self._gpio_levels = self._open_gpiomem()
+            # Polling source for reads the edge watcher can't serve
+            if self._gpio_levels is not None:
+                self._read_digital_pins = self._read_digital_pins_gpiomem
+            else:
+                self._read_digital_pins = self._read_digital_pins_gpio
+
             self.logger.info("HardwarePiPowerAdapter GPIO pins initialized.")
 
         except Exception as e:
             self.logger.error(f"Failed to initialize PiPower GPIO pins: {e}")
             raise SensorReadError(f"Failed to initialize PiPower GPIO pins: {e}") from e
 
-    def _read_adc_voltage(self, channel: int) -> Optional[float]:
+    def _start_edge_watch(self) -> bool:
         """
-        Placeholder for reading voltage from an ADC.
-        The BT_LV pin outputs 1/3 of the battery voltage.
-        This function should return the voltage read AT THE BT_LV PIN.
+        Follow IN_DT, CHG and LO_DT through gpiod edge events.
+
+        A daemon thread waits on both-edge events for the configured pins
+        and keeps self._edge_levels current, so reads need no GPIO access.
+
+        Returns:
+            True if the watcher is running, False if gpiod (libgpiod v1
+            bindings) or the GPIO character device is unavailable.
         """
-        # IMPORTANT: Implement your ADC reading logic here.
-        # This is an example assuming an MCP3008 and a library that returns raw ADC values.
-        # from MCP3008 import MCP3008 # Example import
-        # adc = MCP3008() # Example initialization
-        # raw_value = adc.read(channel)
-        # adc_max_value = 1023 # For a 10-bit ADC
-        # reference_voltage = 3.3 # Raspberry Pi's 3.3V rail often used as ADC VREF
-        # pin_voltage = (raw_value / adc_max_value) * reference_voltage
-        # return pin_voltage
-        self.logger.warning(
-            "ADC reading for BT_LV not implemented. Returning None for battery voltage."
+        offsets = [pin for pin in self._digital_pins if pin is not None]
+        if not offsets:
+            return False
+        try:
+            import gpiod  # type: ignore
+
+            chip = gpiod.Chip(_GPIOCHIP)
+            lines = chip.get_lines(offsets)
+            lines.request(consumer="pipower", type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+            values = dict(zip(offsets, lines.get_values()))
+        except (ImportError, AttributeError, OSError) as e:
+            self.logger.debug(f"gpiod edge events unavailable, polling pins: {e}")
+            return False
+
+        self._edge_levels = tuple(
+            None if pin is None else bool(values[pin]) for pin in self._digital_pins
+        )
+        self._edge_lines = lines
+        self._edge_stop.clear()
+        self._edge_thread = threading.Thread(
+            target=self._watch_edges,
+            args=(gpiod.LineEvent.RISING_EDGE,),
+            name="pipower-edges",
+            daemon=True,
         )
-        return None
+        self._edge_thread.start()
+        self.logger.info(f"Following PiPower pins {offsets} via gpiod edge events.")
+        return True
+
+    def _watch_edges(self, rising_edge: int) -> None:
+        """Apply edge events to self._edge_levels until cleanup() stops it."""
+        lines = self._edge_lines
+        slots = {pin: i for i, pin in enumerate(self._digital_pins) if pin is not None}
+        # The initial levels are read before this thread starts, and only this
+        # thread updates them afterwards
+        current = self._edge_levels
+        if current is None:
+            return
+        try:
+            while not self._edge_stop.is_set():
+                ready = lines.event_wait(sec=_EDGE_WAIT_S)
+                if not ready:
+                    continue
+                levels = list(current)
+                for line in ready:
+                    event = line.event_read()
+                    levels[slots[line.offset()]] = event.type == rising_edge
+                # Swap in a new tuple so readers never see a partial update
+                current = tuple(levels)
+                self._edge_levels = current
+        except Exception as e:
+            # Fall back to polling rather than serving stale levels
+            self.logger.error(f"PiPower edge watcher failed, polling pins: {e}")
+            self._edge_levels = None
 
-    def read_status(self) -> PiPowerReading:
-        if GPIO is None:
-            raise SensorReadError("RPi.GPIO not available.")
+    def _open_gpiomem(self) -> Optional[mmap.mmap]:
+        """
+        Map the GPIO register block for direct pin level reads.
+
+        Returns:
+            Read-only mapping of /dev/gpiomem, or None if it can't be opened
+            (not a BCM283x Pi, or no permission), in which case pins are read
+            through GPIO.input().
+        """
+        try:
+            fd = os.open(_GPIOMEM_PATH, os.O_RDWR | os.O_SYNC)
+        except OSError as e:
+            self.logger.debug(
+                f"{_GPIOMEM_PATH} unavailable, reading pins via GPIO.input: {e}"
+            )
+            return None
+        try:
+            return mmap.mmap(fd, _GPIOMEM_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+        except OSError as e:
+            self.logger.debug(
+                f"Could not map {_GPIOMEM_PATH}, reading pins via GPIO.input: {e}"
+            )
+            return None
+        finally:
+            os.close(fd)  # The mapping stays valid after the fd is closed
+
+    def _read_digital_pins_gpiomem(
+        self,
+    ) -> Tuple[Optional[bool], Optional[bool], Optional[bool]]:
+        """Read IN_DT, CHG and LO_DT from a single GPLEV0 register load."""
+        gpio_levels = self._gpio_levels
+        if gpio_levels is None:
+            raise SensorReadError("GPIO register mapping not available.")
+        # unpack_from reads straight out of the mapping without slicing a copy
+        (levels,) = _GPLEV0.unpack_from(gpio_levels, _GPLEV0_OFFSET)
+        in_dt_mask, chg_mask, lo_dt_mask = self._pin_masks
+        return (
+            None if in_dt_mask is None else bool(levels & in_dt_mask),
+            None if chg_mask is None else bool(levels & chg_mask),
+            None if lo_dt_mask is None else bool(levels & lo_dt_mask),
+        )
+
+    def _read_digital_pins_gpio(
+        self,
+    ) -> Tuple[Optional[bool], Optional[bool], Optional[bool]]:
+        """Read IN_DT, CHG and LO_DT with one GPIO.input() call per pin."""
+        gpio_input = GPIO.input
+        high = GPIO.HIGH
+        in_dt, chg, lo_dt = self._digital_pins
+        return (
+            None if in_dt is None else gpio_input(in_dt) == high,
+            None if chg is None else gpio_input(chg) == high,
+            None if lo_dt is None else gpio_input(lo_dt) == high,
+        )
+
+    def _open_spi(self) -> Any:
+        """
+        Open the SPI device the MCP3008 is wired to.
+
+        Returns:
+            spidev.SpiDev, or None if spidev or the SPI device is unavailable,
+            in which case battery voltage readings are None.
+        """
+        try:
+            import spidev  # type: ignore
+
+            spi = spidev.SpiDev()
+            spi.open(_SPI_BUS, _SPI_DEVICE)
+            spi.max_speed_hz = _MCP3008_MAX_SPEED_HZ
+            return spi
+        except (ImportError, OSError) as e:
+            self.logger.warning(
+                f"MCP3008 on SPI{_SPI_BUS}.{_SPI_DEVICE} unavailable ({e}). "
+                "Battery voltage reading will not be available."
+            )
+            return None
+
+    def _open_pigpio_spi(self) -> Any:
+        """
+        Connect to the pigpio daemon and open bit-banged SPI to the MCP3008.
+
+        pigpiod bit-bangs each transfer in software inside the daemon, so
+        the frame is clocked by that process rather than this one. The pins
+        are the SPI0 pins, so the kernel SPI0 driver must be disabled.
+
+        Returns:
+            pigpio.pi, or None if pigpio or its daemon is unavailable, in
+            which case battery voltage readings are None.
+        """
+        try:
+            import pigpio  # type: ignore
+
+            pi = pigpio.pi()
+            if not pi.connected:
+                raise OSError("pigpio daemon not running")
+            pi.bb_spi_open(
+                _BB_SPI_CS, _BB_SPI_MISO, _BB_SPI_MOSI, _BB_SPI_SCLK, _BB_SPI_BAUD, 0
+            )
+            return pi
+        except (ImportError, OSError) as e:
+            self.logger.warning(
+                f"MCP3008 over pigpio unavailable ({e}). "
+                "Battery voltage reading will not be available."
+            )
+            return None
+
+    def _read_adc_raw_pigpio(self) -> int:
+        """Read the raw BT_LV count from the MCP3008 over pigpio."""
+        _, response = self._pigpio.bb_spi_xfer(_BB_SPI_CS, self._adc_tx)
+        return ((response[1] & 0x03) << 8) | response[2]
 
+    def _read_adc_raw_spidev(self) -> int:
+        """Read the raw BT_LV count from the MCP3008 over spidev."""
+        # xfer2 copies the request into its own transfer buffer, so one
+        # immutable frame serves every read. spidev has no read-into API and
+        # always returns a new list, so there is no receive buffer to reuse.
+        response = self._spi.xfer2(self._adc_tx)
+        return ((response[1] & 0x03) << 8) | response[2]
+
+    def read_status(self) -> PiPowerReading:
+        # __init__ refuses to build this adapter without RPi.GPIO, so GPIO is
+        # known to be available here
         battery_voltage_actual: Optional[float] = None
         is_usb_power_input: Optional[bool] = None
         is_charging: Optional[bool] = None
         is_low_battery: Optional[bool] = None
+        # Debug logging is off in normal operation, so skip formatting entirely
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Read BT_LV (Battery Voltage) via ADC if one is configured and open
+        read_adc_raw = self._read_adc_raw
+        if read_adc_raw is not None:
+            raw_value = read_adc_raw()
+            battery_voltage_actual = raw_value * self._adc_to_battery
+            if debug:
+                self.logger.debug(
+                    "BT_LV (pin %s, ADC ch %s): %.2fV -> Battery: %.2fV",
+                    self.pins["BT_LV"],
+                    self.adc_channel,
+                    raw_value * self._adc_volts_per_count,
+                    battery_voltage_actual,
+                )
+        elif debug and self.adc_channel is not None:
+            self.logger.debug(
+                "BT_LV (pin %s, ADC ch %s): No ADC reading",
+                self.pins["BT_LV"],
+                self.adc_channel,
+            )
 
-        try:
-            # Read BT_LV (Battery Voltage) via ADC if configured
-            if self.adc_channel is not None:
-                bt_lv_pin_voltage = self._read_adc_voltage(self.adc_channel)
-                if bt_lv_pin_voltage is not None:
-                    battery_voltage_actual = (
-                        bt_lv_pin_voltage * 3.0
-                    )  # BT_LV is 1/3 of actual battery voltage
-                    self.logger.debug(
-                        f"BT_LV (pin {self.pins['BT_LV']}, ADC ch {self.adc_channel}): {bt_lv_pin_voltage:.2f}V -> Battery: {battery_voltage_actual:.2f}V"
-                    )
-                else:
-                    self.logger.debug(
-                        f"BT_LV (pin {self.pins['BT_LV']}, ADC ch {self.adc_channel}): No ADC reading"
-                    )
+        # The edge watcher clears its levels if it dies, so check it per read
+        edge_levels = self._edge_levels
+        if edge_levels is None:
+            edge_levels = self._read_digital_pins()
+        is_usb_power_input, is_charging, is_low_battery = edge_levels
 
-            # Read IN_DT (Input Detect)
-            if self.pins["IN_DT"] is not None:
-                is_usb_power_input = GPIO.input(self.pins["IN_DT"]) == GPIO.HIGH
+        if debug:
+            # IN_DT (Input Detect)
+            if is_usb_power_input is not None:
                 self.logger.debug(
-                    f"IN_DT (pin {self.pins['IN_DT']}): {'High (USB Power)' if is_usb_power_input else 'Low (No USB Power)'}"
+                    "IN_DT (pin %s): %s",
+                    self.pins["IN_DT"],
+                    _USB_STR[is_usb_power_input],
                 )
 
-            # Read CHG (Charging Status)
-            if self.pins["CHG"] is not None:
-                is_charging = GPIO.input(self.pins["CHG"]) == GPIO.HIGH
+            # CHG (Charging Status)
+            if is_charging is not None:
                 self.logger.debug(
-                    f"CHG (pin {self.pins['CHG']}): {'High (Charging)' if is_charging else 'Low (Not Charging)'}"
+                    "CHG (pin %s): %s",
+                    self.pins["CHG"],
+                    _CHG_STR[is_charging],
                 )
 
-            # Read LO_DT (Low Battery Detect)
-            if self.pins["LO_DT"] is not None:
-                is_low_battery = GPIO.input(self.pins["LO_DT"]) == GPIO.HIGH
+            # LO_DT (Low Battery Detect)
+            if is_low_battery is not None:
                 self.logger.debug(
-                    f"LO_DT (pin {self.pins['LO_DT']}): {'High (Low Battery)' if is_low_battery else 'Low (Normal)'}"
+                    "LO_DT (pin %s): %s",
+                    self.pins["LO_DT"],
+                    _LO_DT_STR[is_low_battery],
                 )
 
-            return PiPowerReading(
-                battery_voltage=battery_voltage_actual,
-                is_usb_power_input=is_usb_power_input,
-                is_charging=is_charging,
-                is_low_battery=is_low_battery,
-                timestamp=time.time(),
-            )
-        except Exception as e:
-            self.logger.error(f"Error reading PiPower hardware status: {e}")
-            raise SensorReadError(f"Error reading PiPower hardware status: {e}") from e
+        return PiPowerReading(
+            battery_voltage=battery_voltage_actual,
+            is_usb_power_input=is_usb_power_input,
+            is_charging=is_charging,
+            is_low_battery=is_low_battery,
+            timestamp=time.monotonic_ns(),
+        )
 
     def cleanup(self) -> None:
-        if GPIO is not None:
-            self.logger.info("Cleaning up PiPower GPIO pins.")
-            # GPIO.cleanup() # Be careful with global cleanup if other parts of app use GPIO
-        else:
-            self.logger.info(
-                "RPi.GPIO not available, no hardware cleanup needed for PiPower."
-            )
+        if self._edge_thread is not None:
+            self._edge_stop.set()
+            self._edge_thread.join(timeout=_EDGE_WAIT_S + 1)
+            self._edge_thread = None
+            self._edge_levels = None
+            self._edge_lines.release()
+            self._edge_lines = None
+        self._read_adc_raw = None
+        if self._spi is not None:
+            self._spi.close()
+            self._spi = None
+        if self._pigpio is not None:
+            self._pigpio.bb_spi_close(_BB_SPI_CS)
+            self._pigpio.stop()
+            self._pigpio = None
+        if self._gpio_levels is not None:
+            self._read_digital_pins = self._read_digital_pins_gpio
+            self._gpio_levels.close()
+            self._gpio_levels = None
+        self.logger.info("Cleaning up PiPower GPIO pins.")
+        # GPIO.cleanup() # Be careful with global cleanup if other parts of app use GPIO
 
 
 class SimulatedPiPowerAdapter(PiPowerSensorAdapter):
@@ -262,6 +571,20 @@ class SimulatedPiPowerAdapter(PiPowerSensorAdapter):
         self.usb_connected = True
         self.is_charging_sim = True
         self.low_battery_sim = False
+        # Random draws are generated a block at a time and consumed one per
+        # reading; Python lists because indexing them yields plain floats
+        self._np_rng = np.random.default_rng()
+        self._voltage_steps: List[float] = []
+        self._usb_toggles: List[bool] = []
+        self._draw_index = 0
+        self._refill_draws()
+
+    def _refill_draws(self) -> None:
+        """Pre-generate the next block of voltage steps and USB toggle draws."""
+        rng = self._np_rng
+        self._voltage_steps = rng.uniform(0.01, 0.05, _SIM_BLOCK_SIZE).tolist()
+        self._usb_toggles = (rng.random(_SIM_BLOCK_SIZE) < 0.05).tolist()
+        self._draw_index = 0
 
     def initialize(
         self, pins: Dict[str, int], adc_channel: Optional[int] = None
@@ -272,13 +595,25 @@ class SimulatedPiPowerAdapter(PiPowerSensorAdapter):
         # No actual hardware to initialize
 
     def read_status(self) -> PiPowerReading:
+        i = self._draw_index
+        if i == _SIM_BLOCK_SIZE:
+            self._refill_draws()
+            i = 0
+        self._draw_index = i + 1
+        step = self._voltage_steps[i]
+
         # Simulate battery voltage changes
         if self.usb_connected and self.is_charging_sim:
-            self.battery_voltage += random.uniform(0.01, 0.05)  # Charging
+            voltage = self.battery_voltage + step  # Charging
         else:
-            self.battery_voltage -= random.uniform(0.01, 0.05)  # Discharging
+            voltage = self.battery_voltage - step  # Discharging
 
-        self.battery_voltage = max(6.0, min(8.4, self.battery_voltage))  # Clamp voltage
+        # Clamp voltage
+        if voltage > 8.4:
+            voltage = 8.4
+        elif voltage < 6.0:
+            voltage = 6.0
+        self.battery_voltage = voltage
 
         # Simulate low battery
         self.low_battery_sim = self.battery_voltage < 6.8
@@ -292,10 +627,11 @@ class SimulatedPiPowerAdapter(PiPowerSensorAdapter):
             self.is_charging_sim = False
 
         # Occasionally toggle USB power for simulation variety
-        if random.random() < 0.05:
+        if self._usb_toggles[i]:
             self.usb_connected = not self.usb_connected
             self.logger.debug(
-                f"Simulated USB power toggled to: {'Connected' if self.usb_connected else 'Disconnected'}"
+                "Simulated USB power toggled to: %s",
+                "Connected" if self.usb_connected else "Disconnected",
             )
 
         reading = PiPowerReading(
@@ -303,9 +639,9 @@ class SimulatedPiPowerAdapter(PiPowerSensorAdapter):
             is_usb_power_input=self.usb_connected,
             is_charging=self.is_charging_sim,
             is_low_battery=self.low_battery_sim,
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
         )
-        self.logger.debug(f"SimulatedPiPowerAdapter reading: {reading}")
+        self.logger.debug("SimulatedPiPowerAdapter reading: %s", reading)
         return reading
 
     def cleanup(self) -> None:
@@ -335,11 +671,46 @@ class PiPowerMonitor:
         self.adc_channel = self.config.get("adc_channel")  # For BT_LV
 
         self.log_readings = self.config.get("log_readings", True)
+        # is_healthy() counts the sensor healthy while the last reading is
+        # younger than this; by default two measurement intervals, matching
+        # PiPowerRunner's own staleness check
+        health_ttl_s = self.config.get(
+            "health_ttl_s", 2 * self.config.get("measurement_interval", 1.0)
+        )
+        self._health_ttl_ns = int(health_ttl_s * 1e9)
+
+        # get_status() fields that never change, copied into each status dict.
+        # The nested pins dict is shared between calls.
+        self._static_status: Dict[str, Any] = {
+            "sensor_type": "PiPowerV2",
+            "mode": (
+                "production"
+                if self.production and GPIO is not None
+                else "development/simulated"
+            ),
+            "pins_configured": self.pins,
+            "adc_channel_configured": self.adc_channel,
+        }
+        # (reading, status dict) so each reading is converted only once
+        self._reading_status: Optional[Tuple[PiPowerReading, Dict[str, Any]]] = None
 
         self.sensor_adapter: PiPowerSensorAdapter
         self._last_reading: Optional[PiPowerReading] = None
         self._init_sensor_adapter()
 
+        # Optional background sampling: a thread reads the sensor every
+        # sample_interval_s and get_reading() returns the latest sample
+        self._sample_interval: Optional[float] = self.config.get("sample_interval_s")
+        self._latest: Optional[PiPowerReading] = None
+        self._sample_error: Optional[Exception] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        if self._sample_interval is not None:
+            self._sampler = threading.Thread(
+                target=self._sample_loop, name="pipower-sampler", daemon=True
+            )
+            self._sampler.start()
+
         self.logger.info(
             f"PiPower Monitor initialized. Mode: {'Production' if production else 'Development'}"
         )
@@ -360,7 +731,14 @@ class PiPowerMonitor:
                     )
                     self.sensor_adapter = SimulatedPiPowerAdapter()
                 else:
-                    self.sensor_adapter = HardwarePiPowerAdapter()
+                    self.sensor_adapter = HardwarePiPowerAdapter(
+                        adc_vref=self.config.get("adc_vref", _DEFAULT_ADC_VREF),
+                        adc_max=self.config.get("adc_max", _DEFAULT_ADC_MAX),
+                        bt_lv_divider=self.config.get(
+                            "bt_lv_divider", _DEFAULT_BT_LV_DIVIDER
+                        ),
+                        use_pigpio=self.config.get("use_pigpio", False),
+                    )
             else:
                 self.sensor_adapter = SimulatedPiPowerAdapter()
 
@@ -388,6 +766,9 @@ class PiPowerMonitor:
             )
             raise
 
+        # Bind once so each reading skips the sensor_adapter attribute lookup
+        self._read_status = self.sensor_adapter.read_status
+
     def get_reading(self) -> PiPowerReading:
         """
         Get a complete status reading from PiPower.
@@ -398,37 +779,57 @@ class PiPowerMonitor:
             SensorReadError if reading fails.
         """
         try:
-            reading = self.sensor_adapter.read_status()
+            reading = self._next_reading()
             self._last_reading = reading
 
-            if self.log_readings:
+            if self.log_readings and self.logger.isEnabledFor(logging.DEBUG):
                 voltage_str = (
                     f"{reading.battery_voltage:.2f}V"
                     if reading.battery_voltage is not None
                     else "N/A"
                 )
-                usb_str = "USB In" if reading.is_usb_power_input else "No USB"
-                charge_str = "Charging" if reading.is_charging else "Not Charging"
-                low_batt_str = "LOW BATT" if reading.is_low_battery else "Batt OK"
-
-                # Handle cases where boolean flags might be None
-                if reading.is_usb_power_input is None:
-                    usb_str = "USB N/A"
-                if reading.is_charging is None:
-                    charge_str = "Charge N/A"
-                if reading.is_low_battery is None:
-                    low_batt_str = "LowBatt N/A"
-
                 self.logger.debug(
-                    f"PiPower Status - Voltage: {voltage_str}, {usb_str}, {charge_str}, {low_batt_str}"
+                    "PiPower Status - Voltage: %s, %s, %s, %s",
+                    voltage_str,
+                    _USB_SUMMARY[reading.is_usb_power_input],
+                    _CHG_SUMMARY[reading.is_charging],
+                    _LO_DT_SUMMARY[reading.is_low_battery],
                 )
             return reading
         except SensorReadError as e:
             self.logger.error(f"Failed to get PiPower reading: {e}")
             raise
         except Exception as e:
+            # Adapters raise whatever their driver raises; this is the one
+            # place those errors become SensorReadError
             self.logger.error(f"Unexpected error during PiPower reading: {e}")
-            raise SensorReadError(f"Unexpected error during PiPower reading: {e}")
+            raise SensorReadError(
+                f"Unexpected error during PiPower reading: {e}"
+            ) from e
+
+    def _next_reading(self) -> PiPowerReading:
+        """Return the sampler's latest reading, or read the sensor directly."""
+        if self._sampler is None:
+            return self._read_status()
+        error = self._sample_error
+        if error is not None:
+            # A fresh exception per call; re-raising the stored one would
+            # extend its traceback on every failed reading
+            raise SensorReadError(f"Background sample failed: {error}") from error
+        reading = self._latest
+        # Before the first sample lands, read synchronously
+        return reading if reading is not None else self._read_status()
+
+    def _sample_loop(self) -> None:
+        """Sample the sensor every sample_interval_s until cleanup()."""
+        while True:
+            try:
+                self._latest = self._read_status()
+                self._sample_error = None
+            except Exception as e:
+                self._sample_error = e
+            if self._sampler_stop.wait(self._sample_interval):
+                break
 
     def get_last_reading(self) -> Optional[PiPowerReading]:
         """
@@ -438,14 +839,31 @@ class PiPowerMonitor:
 
     def is_healthy(self) -> bool:
         """
-        Check if the sensor is responding.
-        For PiPower, this mainly means we can attempt a read without critical errors.
+        Check if the sensor is responding, judged from the last reading.
+
+        The sensor is healthy while its last successful reading is younger
+        than health_ttl_s. This never touches the sensor, so get_status()
+        right after get_reading() costs no extra bus traffic; use
+        probe_health() to actively test the sensor.
         More specific health (e.g. voltage range) can be checked by the runner.
         """
+        reading = self._last_reading
+        return (
+            reading is not None
+            and time.monotonic_ns() - reading.timestamp < self._health_ttl_ns
+        )
+
+    def probe_health(self) -> bool:
+        """
+        Check if the sensor is responding by taking a fresh reading.
+
+        For PiPower, this mainly means we can attempt a read without critical
+        errors. The reading is not stored.
+        """
         try:
             # Attempt a quick read; if it fails with SensorReadError, it's unhealthy.
             # We don't store this reading, just check if the call succeeds.
-            test_reading = self.sensor_adapter.read_status()
+            test_reading = self._read_status()
             # Basic check: at least timestamp should be present.
             return test_reading.timestamp > 0
         except SensorReadError:
@@ -462,31 +880,32 @@ class PiPowerMonitor:
         Get comprehensive status information about the PiPower monitor.
         """
         reading = self.get_last_reading()
-        status = {
-            "sensor_type": "PiPowerV2",
-            "mode": (
-                "production"
-                if self.production and GPIO is not None
-                else "development/simulated"
-            ),
-            "healthy": self.is_healthy(),
-            "last_reading": None,
-            "pins_configured": self.pins,
-            "adc_channel_configured": self.adc_channel,
-        }
+        status = self._static_status.copy()
+        status["healthy"] = self.is_healthy()
+        status["last_reading"] = None
 
         if reading:
-            status["last_reading"] = {
-                "battery_voltage": reading.battery_voltage,
-                "is_usb_power_input": reading.is_usb_power_input,
-                "is_charging": reading.is_charging,
-                "is_low_battery": reading.is_low_battery,
-                "timestamp": reading.timestamp,
-            }
+            cached = self._reading_status
+            if cached is None or cached[0] is not reading:
+                cached = self._reading_status = (
+                    reading,
+                    {
+                        "battery_voltage": reading.battery_voltage,
+                        "is_usb_power_input": reading.is_usb_power_input,
+                        "is_charging": reading.is_charging,
+                        "is_low_battery": reading.is_low_battery,
+                        "timestamp": reading.timestamp,
+                    },
+                )
+            status["last_reading"] = cached[1]
         return status
 
     def cleanup(self) -> None:
         """Cleanup resources used by the sensor adapter."""
+        if self._sampler is not None:
+            self._sampler_stop.set()
+            self._sampler.join()
+            self._sampler = None
         if hasattr(self, "sensor_adapter") and self.sensor_adapter:
             self.sensor_adapter.cleanup()
         self.logger.debug("PiPowerMonitor cleaned up.")
@@ -6,17 +6,47 @@ Logitech HD C270, to capture images.
 """
 
 import abc
+import contextlib
 import logging
 import os
+import tempfile
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import cv2  # OpenCV for camera access
 import numpy as np  # For creating simulated images
 
 from config.paths import ROOT_DIR
 
+# How long capture_image() waits for the capture thread's first frame
+_FIRST_FRAME_TIMEOUT_S = 2.0
+# How long opening the camera may take before falling back (open_timeout_s)
+_DEFAULT_OPEN_TIMEOUT_S = 3.0
+# Grabs allowed for a newly opened camera to deliver its first frame
+_WARMUP_GRABS = 30
+_WARMUP_RETRY_S = 0.03
+# Pause after a failed background read before trying again
+_READ_RETRY_S = 0.05
+# A grab slower than this waited for a new frame, so the queue is drained
+_DRAIN_WAIT_S = 1.0 / 60
+_MAX_DRAIN_GRABS = 8  # Bounds draining on backends that never block
+# A camera whose newest frame is older than this many frame periods (but
+# at least _MIN_STALE_S) is unhealthy; FPS is assumed if the backend can't say
+_STALE_FRAME_PERIODS = 2
+_MIN_STALE_S = 1.0
+_DEFAULT_FPS = 30.0
+_FPS_WINDOW = 10  # Frame intervals the measured frame rate averages over
+# Consecutive failed health checks before WebcamSensor reopens the camera
+_RECOVER_AFTER_CHECKS = 3
+# Photos waiting for the writer threads before the oldest is dropped
+_WRITE_QUEUE_SIZE = 16
+_DROP_LOG_EVERY = 100  # Warn on the first dropped photo and every 100th after
+# Photo writer threads shared by all webcams; encoders release the GIL
+_WRITER_THREADS = min(4, os.cpu_count() or 1)
+
 
 # Custom Exception for sensor reading errors
 class SensorConfigError(ValueError):
@@ -63,19 +93,65 @@ class WebcamAdapter(abc.ABC):
         """Check if the adapter and camera are operational."""
         pass
 
+    def frame_rate(self) -> Optional[float]:
+        """Measured frames per second, or None if not tracked."""
+        return None
+
+    def capture_image_view(self) -> np.ndarray:
+        """
+        Capture an image the caller will only read.
+
+        The result may be read-only and shared with other callers; adapters
+        that can avoid copying a frame for this override it.
+        """
+        return self.capture_image()
+
+    def recover(self) -> bool:
+        """
+        Reopen the webcam after it stopped working.
+
+        Returns:
+            True if the webcam is healthy again
+        Raises:
+            SensorConfigError if the webcam cannot be reinitialized.
+        """
+        self.release()
+        self.initialize()
+        return self.is_healthy()
+
 
 class HardwareWebcamAdapter(WebcamAdapter):
     """Adapter for a physical webcam using OpenCV."""
 
     def __init__(
-        self, camera_id: int = 0, resolution: Optional[Tuple[int, int]] = None
+        self,
+        camera_id: int = 0,
+        resolution: Optional[Tuple[int, int]] = None,
+        open_timeout_s: float = _DEFAULT_OPEN_TIMEOUT_S,
     ):
         self.camera_id = camera_id
         self.resolution = resolution  # e.g., (1280, 720)
+        self.open_timeout_s = open_timeout_s
         self.cap: Optional[cv2.VideoCapture] = None
         self.logger = logging.getLogger(__name__)
         self._initialized = False
 
+        # A capture thread keeps reading so the newest frame is always on
+        # hand; capture_image() copies it instead of waiting on the camera
+        # and getting whatever old frame the driver had queued
+        self._latest: Optional[np.ndarray] = None
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._stop_evt = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        # time.monotonic() of the newest frame, and how old it may get
+        self._last_frame_ts = 0.0
+        self._stale_after_s = _MIN_STALE_S
+        # Recent frame intervals, and the frame rate over them, kept by the
+        # capture thread so readers of the rate pay nothing per call
+        self._frame_intervals: Deque[float] = deque(maxlen=_FPS_WINDOW)
+        self._fps: Optional[float] = None
+
     def initialize(self) -> None:
         try:
             self.logger.info(f"Initializing hardware webcam (ID: {self.camera_id})...")
@@ -92,7 +168,7 @@ class HardwareWebcamAdapter(WebcamAdapter):
             for backend, backend_name in backends:
                 try:
                     self.logger.debug(f"Trying backend: {backend_name}")
-                    self.cap = cv2.VideoCapture(self.camera_id, backend)
+                    self.cap = self._open_capture(backend)
                     if self.cap.isOpened():
                         self.logger.info(
                             f"Successfully opened webcam using {backend_name} backend"
@@ -101,6 +177,8 @@ class HardwareWebcamAdapter(WebcamAdapter):
                     else:
                         self.cap.release()
                         self.cap = None
+                except SensorCaptureError:
+                    raise  # Timed out; other backends would hang the same way
                 except Exception as e:
                     last_error = e
                     self.logger.debug(
@@ -116,6 +194,16 @@ class HardwareWebcamAdapter(WebcamAdapter):
                     f"Cannot open webcam (ID: {self.camera_id}). Check if it is connected and not in use. Last error: {last_error}"
                 )
 
+            # Keep at most one frame queued in the driver so reads are fresh;
+            # backends that don't support this ignore it
+            try:
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                self.logger.debug(
+                    "Webcam buffer size: %s", self.cap.get(cv2.CAP_PROP_BUFFERSIZE)
+                )
+            except cv2.error as e:
+                self.logger.debug(f"Webcam buffer size not adjustable: {e}")
+
             if self.resolution:
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
@@ -124,13 +212,31 @@ class HardwareWebcamAdapter(WebcamAdapter):
                 )
 
             # Try to grab a frame to confirm it's working
-            ret, frame = self.cap.read()
-            if not ret or frame is None:
+            frame = self._warm_up(self.cap)
+            if frame is None:
                 self.release()  # Release if initial frame grab fails
                 raise SensorCaptureError(
                     f"Failed to grab initial frame from webcam (ID: {self.camera_id})."
                 )
 
+            frame.setflags(write=False)
+            self._latest = frame
+            self._last_frame_ts = time.monotonic()
+            self._frame_ready.set()
+            fps = self.cap.get(cv2.CAP_PROP_FPS) or 0.0
+            self._stale_after_s = max(
+                _STALE_FRAME_PERIODS / (fps if fps > 0 else _DEFAULT_FPS),
+                _MIN_STALE_S,
+            )
+            self._stop_evt.clear()
+            self._reader = threading.Thread(
+                target=self._reader_loop,
+                args=(self.cap,),
+                name=f"webcam-capture-{self.camera_id}",
+                daemon=True,
+            )
+            self._reader.start()
+
             self.logger.info(
                 f"Hardware webcam (ID: {self.camera_id}) initialized successfully."
             )
@@ -144,21 +250,151 @@ class HardwareWebcamAdapter(WebcamAdapter):
                 f"Failed to initialize webcam (ID: {self.camera_id}): {e}"
             ) from e
 
+    @staticmethod
+    def _warm_up(cap: cv2.VideoCapture) -> Optional[np.ndarray]:
+        """
+        Grab until a newly opened camera delivers its first frame, and decode it.
+
+        Many webcams fail their first few grabs while starting up; retrying
+        returns as soon as one succeeds instead of sleeping a fixed time.
+
+        Returns:
+            The first frame, or None if none arrived within the warm-up grabs
+        """
+        for _ in range(_WARMUP_GRABS):
+            if cap.grab():
+                ret, frame = cap.retrieve()
+                return frame if ret else None
+            time.sleep(_WARMUP_RETRY_S)
+        return None
+
+    def _open_capture(self, backend: int) -> cv2.VideoCapture:
+        """
+        Open the camera on a helper thread, giving up after open_timeout_s.
+
+        Some backends block for many seconds opening certain webcams, which
+        would stall whoever is constructing the sensor.
+
+        Raises:
+            SensorCaptureError if opening takes longer than open_timeout_s.
+        """
+        opened: List[cv2.VideoCapture] = []
+        abandoned: List[bool] = []
+        lock = threading.Lock()
+
+        def open_capture() -> None:
+            cap = cv2.VideoCapture(self.camera_id, backend)
+            with lock:
+                if abandoned:
+                    cap.release()  # Nobody is waiting for it any more
+                else:
+                    opened.append(cap)
+
+        opener = threading.Thread(
+            target=open_capture, name=f"webcam-open-{self.camera_id}", daemon=True
+        )
+        opener.start()
+        opener.join(self.open_timeout_s)
+        with lock:
+            if opened:
+                return opened[0]
+            if opener.is_alive():
+                abandoned.append(True)
+                raise SensorCaptureError(
+                    f"Opening webcam (ID: {self.camera_id}) timed out after "
+                    f"{self.open_timeout_s}s."
+                )
+        raise SensorCaptureError(f"Opening webcam (ID: {self.camera_id}) failed.")
+
+    def _reader_loop(self, cap: cv2.VideoCapture) -> None:
+        """Read frames from cap into the latest-frame slot until release()."""
+        while not self._stop_evt.is_set():
+            try:
+                ret = self._grab_latest(cap)
+                frame = cap.retrieve()[1] if ret else None
+            except Exception as e:
+                self.logger.error(f"Webcam {self.camera_id} capture thread failed: {e}")
+                return
+            if not ret or frame is None:
+                self._stop_evt.wait(_READ_RETRY_S)
+                continue
+            # Frames are shared by capture_image_view(), so freeze them
+            frame.setflags(write=False)
+            with self._frame_lock:
+                self._latest = frame
+            now = time.monotonic()
+            self._record_frame_interval(now - self._last_frame_ts)
+            self._last_frame_ts = now
+            self._frame_ready.set()
+
+    def _record_frame_interval(self, interval: float) -> None:
+        """Update the windowed frame rate and the staleness limit it implies."""
+        intervals = self._frame_intervals
+        intervals.append(interval)
+        # Frames over total time rather than an average of per-frame rates,
+        # so one slow frame doesn't swing the estimate
+        total = sum(intervals)
+        if total <= 0:
+            return
+        fps = len(intervals) / total
+        self._fps = fps
+        self._stale_after_s = max(_STALE_FRAME_PERIODS / fps, _MIN_STALE_S)
+
+    def frame_rate(self) -> Optional[float]:
+        return self._fps
+
+    @staticmethod
+    def _grab_latest(cap: cv2.VideoCapture) -> bool:
+        """
+        Grab frames until the backend's queue is empty.
+
+        Some backends queue frames even with a one-frame buffer. Grabbing
+        without decoding skips those stale frames cheaply, so only the newest
+        one is retrieved. A grab that had to wait for the camera got a fresh
+        frame, so draining stops there rather than waiting a frame longer.
+
+        Returns:
+            True if a frame is grabbed and ready to retrieve
+        """
+        for _ in range(1 + _MAX_DRAIN_GRABS):
+            start = time.perf_counter()
+            if not cap.grab():
+                return False
+            if time.perf_counter() - start > _DRAIN_WAIT_S:
+                break
+        return True
+
     def capture_image(self) -> np.ndarray:
+        # The caller may draw on or keep the frame, so hand out its own copy
+        return self.capture_image_view().copy()
+
+    def capture_image_view(self) -> np.ndarray:
+        """Return the newest frame itself, read-only, without copying it."""
         if not self.cap or not self._initialized:
             raise SensorCaptureError("Webcam not initialized or already released.")
-        try:
-            ret, frame = self.cap.read()
-            if not ret or frame is None:
-                raise SensorCaptureError(
-                    "Failed to capture image from webcam. No frame received."
-                )
-            return frame
-        except Exception as e:
-            self.logger.error(f"Error capturing image from webcam: {e}")
-            raise SensorCaptureError(f"Error capturing image from webcam: {e}") from e
+        if self._reader is None or not self._reader.is_alive():
+            raise SensorCaptureError(
+                f"Webcam (ID: {self.camera_id}) capture thread is not running."
+            )
+        if not self._frame_ready.wait(_FIRST_FRAME_TIMEOUT_S):
+            raise SensorCaptureError(
+                "Failed to capture image from webcam. No frame received."
+            )
+        with self._frame_lock:
+            frame = self._latest
+        if frame is None:  # release() ran since the checks above
+            raise SensorCaptureError("Webcam not initialized or already released.")
+        return frame
 
     def release(self) -> None:
+        if self._reader is not None:
+            self._stop_evt.set()
+            self._reader.join()
+            self._reader = None
+        self._latest = None
+        self._frame_ready.clear()
+        self._frame_intervals.clear()
+        self._fps = None
         if self.cap and self.cap.isOpened():
             self.cap.release()
             self.logger.info(f"Hardware webcam (ID: {self.camera_id}) released.")
@@ -166,21 +402,12 @@ class HardwareWebcamAdapter(WebcamAdapter):
         self._initialized = False
 
     def is_healthy(self) -> bool:
-        if not self.cap or not self.cap.isOpened() or not self._initialized:
-            return False
-        # Try a quick frame grab
-        try:
-            ret, _ = self.cap.read()
-            if not ret:  # if read fails, try to re-initialize
-                self.logger.warning(
-                    f"Webcam {self.camera_id} failed health check (read failed). Attempting re-init."
-                )
-                self.release()
-                self.initialize()  # try to recover
-                return self.cap is not None and self.cap.isOpened()
-            return True
-        except Exception:
-            return False
+        # Judged from the capture thread's heartbeat; never touches the camera
+        return (
+            self._initialized
+            and self.cap is not None
+            and time.monotonic() - self._last_frame_ts < self._stale_after_s
+        )
 
 
 class SimulatedWebcamAdapter(WebcamAdapter):
@@ -190,30 +417,50 @@ class SimulatedWebcamAdapter(WebcamAdapter):
         self.logger = logging.getLogger(__name__)
         self.resolution = resolution
         self._initialized = False
+        self._base: Optional[np.ndarray] = None  # Blank frame, allocated once
+        # The overlay only changes once a second, so the last rendered frame
+        # is returned again until its timestamp text goes stale
+        self._frame_second = -1  # Unix second the overlay shows
+        self._frame: Optional[np.ndarray] = None
 
     def initialize(self) -> None:
+        self._base = np.zeros(
+            (self.resolution[1], self.resolution[0], 3), dtype=np.uint8
+        )
         self.logger.info("Simulated webcam initialized.")
         self._initialized = True
         # No actual hardware to initialize
 
     def capture_image(self) -> np.ndarray:
-        if not self._initialized:
+        # The caller may draw on or keep the frame, so hand out its own copy
+        return self.capture_image_view().copy()
+
+    def capture_image_view(self) -> np.ndarray:
+        """Return the rendered frame itself, read-only, without copying it."""
+        base = self._base
+        if not self._initialized or base is None:
             raise SensorCaptureError("Simulated webcam not initialized.")
         self.logger.debug("Simulating image capture.")
-        # Create a dummy image
-        img = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
-        # Add some text to identify it as a simulation
-        timestamp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(time.time()))
-        cv2.putText(
-            img,
-            f"Simulated Image {timestamp_str}",
-            (50, 50),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (255, 255, 255),
-            2,
-        )
-        return img
+        second = int(time.time())
+        frame = self._frame
+        if second != self._frame_second or frame is None:
+            timestamp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(second))
+            # Add some text to identify it as a simulation
+            img = base.copy()
+            cv2.putText(
+                img,
+                f"Simulated Image {timestamp_str}",
+                (50, 50),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (255, 255, 255),
+                2,
+            )
+            # Shared between captures, so callers get it read-only
+            img.setflags(write=False)
+            self._frame_second = second
+            self._frame = frame = img
+        return frame
 
     def release(self) -> None:
         self.logger.info("Simulated webcam released.")
@@ -223,6 +470,115 @@ class SimulatedWebcamAdapter(WebcamAdapter):
         return self._initialized
 
 
+class _PhotoWriter:
+    """
+    Saves photos for every WebcamSensor on one shared pool of threads.
+
+    With several cameras, a pool per camera would leave threads idle while
+    another camera's queue backs up; sharing spreads encodes across cores.
+    Threads run while at least one sensor holds the writer.
+
+    When photos arrive faster than they can be saved, the oldest queued
+    photo is dropped rather than blocking the capture or growing the queue
+    (each 1080p frame is ~6 MB).
+    """
+
+    def __init__(self):
+        self._items: Deque[Tuple["WebcamSensor", np.ndarray, str]] = deque()
+        self._threads: List[threading.Thread] = []
+        self._users = 0
+        self._lifecycle_lock = threading.Lock()  # Serializes acquire/release
+        # _lock guards _items, _pending and _stopping
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)  # Photos queued
+        self._idle = threading.Condition(self._lock)  # A sensor's photos done
+        # Photos queued or being saved, per sensor
+        self._pending: Dict["WebcamSensor", int] = {}
+        self._stopping = False
+
+    def acquire(self) -> None:
+        """Register a sensor, starting the threads for the first one."""
+        with self._lifecycle_lock:
+            self._users += 1
+            if not self._threads:
+                self._threads = [
+                    threading.Thread(
+                        target=self._worker, name=f"webcam-writer-{i}", daemon=True
+                    )
+                    for i in range(_WRITER_THREADS)
+                ]
+                for thread in self._threads:
+                    thread.start()
+
+    def release(self, sensor: "WebcamSensor") -> None:
+        """Wait for a sensor's pending photos, then unregister it."""
+        with self._idle:
+            while self._pending.get(sensor):
+                self._idle.wait()
+        with self._lifecycle_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            threads, self._threads = self._threads, []
+            with self._work:
+                self._stopping = True
+                self._work.notify_all()
+            for thread in threads:
+                thread.join()
+            self._stopping = False
+
+    def submit(self, sensor: "WebcamSensor", image: np.ndarray, file_path: str) -> None:
+        """Queue a photo for saving, dropping the oldest one if the queue is full."""
+        with self._work:
+            if len(self._items) >= _WRITE_QUEUE_SIZE:
+                dropped, _, dropped_path = self._items.popleft()
+                dropped.dropped_photos += 1
+                if dropped.dropped_photos % _DROP_LOG_EVERY == 1:
+                    dropped.logger.warning(
+                        f"Photo writer falling behind; dropped {dropped_path} "
+                        f"({dropped.dropped_photos} dropped so far)"
+                    )
+                self._finish(dropped)
+            self._items.append((sensor, image, file_path))
+            self._pending[sensor] = self._pending.get(sensor, 0) + 1
+            self._work.notify()
+
+    def _finish(self, sensor: "WebcamSensor") -> None:
+        """Account for one of a sensor's photos leaving the writer (lock held)."""
+        self._pending[sensor] -= 1
+        if not self._pending[sensor]:
+            del self._pending[sensor]
+            self._idle.notify_all()
+
+    def _worker(self) -> None:
+        """Save queued photos until release() stops the writer."""
+        while True:
+            with self._work:
+                while not self._items and not self._stopping:
+                    self._work.wait()
+                if not self._items:
+                    return
+                sensor, image, file_path = self._items.popleft()
+            try:
+                sensor.save(image, file_path)
+            except Exception as e:  # save() has already logged it
+                callback = sensor.on_save_error
+                if callback is not None:
+                    # A failing callback must not kill the shared writer thread
+                    try:
+                        callback(e)
+                    except Exception as callback_error:
+                        sensor.logger.error(
+                            f"Photo save error callback failed: {callback_error}"
+                        )
+            finally:
+                with self._lock:
+                    self._finish(sensor)
+
+
+_PHOTO_WRITER = _PhotoWriter()
+
+
 class WebcamSensor:
     """
     Webcam Sensor for capturing images.
@@ -251,13 +607,61 @@ class WebcamSensor:
         output_dir = self.config.get("output_directory", "data/photos").lstrip("/")
         self.output_directory = os.path.join(ROOT_DIR, output_dir)
         self.logger.debug(f"Output directory: {self.output_directory}")
+        # Created once here rather than checked before every save
+        try:
+            os.makedirs(self.output_directory, exist_ok=True)
+        except OSError as e:
+            self.logger.error(
+                f"Failed to create output directory {self.output_directory}: {e}"
+            )
+            raise SensorConfigError(
+                f"Failed to create output directory {self.output_directory}: {e}"
+            ) from e
         self.file_format = self.config.get("file_format", "jpg")
+        self.jpeg_quality = int(self.config.get("jpeg_quality", 95))
+        self._file_ext = "." + self.file_format  # For cv2.imencode
+        # Full photo path as one strftime format, with the directory's own
+        # '%' characters escaped, so naming a photo is a single call
+        self._filename_fmt = (
+            os.path.join(self.output_directory, "webcam_").replace("%", "%%")
+            + "%Y-%m-%d_%H-%M-%S"
+            + self._file_ext.replace("%", "%%")
+        )
+        self.open_timeout_s = float(
+            self.config.get("open_timeout_s", _DEFAULT_OPEN_TIMEOUT_S)
+        )
+        # Accelerated JPEG encoder (BGR frame -> JPEG bytes): nvJPEG on CUDA
+        # hosts, else libjpeg-turbo, else None to use cv2.imencode
+        self._jpeg_encode: Optional[Callable[[np.ndarray], Any]] = None
+        if self.file_format.lower() in ("jpg", "jpeg"):
+            self._jpeg_encode = self._init_nvjpeg() or self._init_turbojpeg()
+
+        # get_status() fields that never change, copied into each status dict
+        self._static_status: Dict[str, Any] = {
+            "sensor_type": "webcam_c270",  # Or a more generic "webcam"
+            "camera_id": self.camera_id,
+            "resolution": self.resolution,
+            "output_directory": self.output_directory,
+            "file_format": self.file_format,
+            "mode": "production" if self.production else "development",
+        }
+        # (capture, status dict) so each capture is converted only once
+        self._capture_status: Optional[Tuple[ImageReading, Dict[str, Any]]] = None
 
         # Initialize sensor adapter
         self.adapter: WebcamAdapter
         self._last_capture: Optional[ImageReading] = None
+        self._failed_health_checks = 0
         self._init_adapter()
 
+        # capture_and_save_photo() hands (image, file_path) to the shared
+        # writer so encoding and disk writes overlap with the next capture.
+        # Called with any error a background save raises.
+        self.on_save_error: Optional[Callable[[Exception], None]] = None
+        self.dropped_photos = 0  # Queued photos the writer had to discard
+        self._writer_held = True
+        _PHOTO_WRITER.acquire()
+
         self.logger.debug(
             f"WebcamSensor initialized - Camera ID: {self.camera_id}, "
             f"Mode: {'Production' if production else 'Development'}, "
@@ -273,7 +677,9 @@ class WebcamSensor:
                 self.logger.info(
                     "Production mode: Initializing hardware webcam adapter."
                 )
-                self.adapter = HardwareWebcamAdapter(self.camera_id, self.resolution)
+                self.adapter = HardwareWebcamAdapter(
+                    self.camera_id, self.resolution, self.open_timeout_s
+                )
                 self.adapter.initialize()
                 self.logger.info(
                     "Hardware webcam adapter initialized successfully in production mode."
@@ -283,7 +689,9 @@ class WebcamSensor:
                     "Development mode: Attempting to initialize hardware webcam adapter..."
                 )
                 try:
-                    hw_adapter = HardwareWebcamAdapter(self.camera_id, self.resolution)
+                    hw_adapter = HardwareWebcamAdapter(
+                        self.camera_id, self.resolution, self.open_timeout_s
+                    )
                     hw_adapter.initialize()
                     self.adapter = hw_adapter
                     self.logger.info(
@@ -330,99 +738,236 @@ class WebcamSensor:
                 f"Unexpected error during adapter setup: {e_main}"
             ) from e_main
 
-    def capture_and_save_photo(self) -> ImageReading:
+    def _init_nvjpeg(self) -> Optional[Callable[[np.ndarray], Any]]:
         """
-        Capture a photo and save it to the configured directory.
+        Load nvJPEG for GPU JPEG encoding on CUDA hosts such as a Jetson.
 
         Returns:
-            ImageReading object with image data and file path.
-        Raises:
-            SensorCaptureError if capturing or saving fails.
-            SensorConfigError if output directory cannot be handled.
+            Encode function, or None if there is no CUDA device or the
+            pynvjpeg bindings are unavailable.
         """
         try:
-            image_data = self.adapter.capture_image()
-            timestamp = time.time()
+            if cv2.cuda.getCudaEnabledDeviceCount() <= 0:
+                return None
+            from nvjpeg import NvJpeg  # type: ignore
 
-            # Ensure output directory exists
-            try:
-                if not os.path.exists(self.output_directory):
-                    os.makedirs(self.output_directory, exist_ok=True)
-                    self.logger.info(
-                        f"Created output directory: {self.output_directory}"
-                    )
-            except OSError as e:
-                self.logger.error(
-                    f"Failed to create output directory {self.output_directory}: {e}"
-                )
-                raise SensorConfigError(
-                    f"Failed to create output directory {self.output_directory}: {e}"
-                ) from e
-
-            # Generate filename
-            filename = f"webcam_{time.strftime('%Y-%m-%d_%H-%M-%S', time.localtime(timestamp))}.{self.file_format}"
-            file_path = os.path.join(self.output_directory, filename)
-
-            # Save the image
-            success = cv2.imwrite(file_path, image_data)
-            if not success:
-                raise SensorCaptureError(f"Failed to save image to {file_path}")
-
-            self.logger.debug(f"Photo captured and saved to {file_path}")
-            reading = ImageReading(
-                image=image_data, timestamp=timestamp, file_path=file_path
-            )
-            self._last_capture = reading
-            return reading
+            encoder = NvJpeg()
+        except (ImportError, AttributeError, OSError, RuntimeError, cv2.error) as e:
+            self.logger.debug(f"nvJPEG unavailable: {e}")
+            return None
+
+        # One encoder state on the GPU, shared by the photo writer threads
+        lock = threading.Lock()
+        quality = self.jpeg_quality
+
+        def encode(image: np.ndarray) -> Any:
+            with lock:
+                return encoder.encode(image, quality)
+
+        self.logger.info("Encoding webcam photos on the GPU with nvJPEG.")
+        return encode
+
+    def _init_turbojpeg(self) -> Optional[Callable[[np.ndarray], Any]]:
+        """
+        Load PyTurboJPEG for SIMD JPEG encoding.
+
+        Returns:
+            Encode function, or None if PyTurboJPEG or libturbojpeg is
+            unavailable, in which case photos are encoded with cv2.imencode.
+        """
+        try:
+            from turbojpeg import TurboJPEG  # type: ignore
+
+            encoder = TurboJPEG()
+        except (ImportError, OSError, RuntimeError) as e:
+            self.logger.debug(f"TurboJPEG unavailable, using cv2.imencode: {e}")
+            return None
+        quality = self.jpeg_quality
+        # Encodes BGR frames directly, as cv2 delivers them
+        return lambda image: encoder.encode(image, quality=quality)
 
+    def capture(self) -> ImageReading:
+        """
+        Capture a photo without writing it to disk.
+
+        The returned reading carries the file path the image should be saved
+        to, so the caller can hand the encode/write step to another thread
+        via save(). The image is read-only and may be shared; copy it
+        before drawing on it.
+
+        Returns:
+            ImageReading object with image data and destination file path.
+        Raises:
+            SensorCaptureError if capturing fails.
+        """
+        try:
+            # Photos are only encoded and inspected, never drawn on
+            image_data = self.adapter.capture_image_view()
         except SensorCaptureError as e:
-            self.logger.error(f"Failed to capture and save photo: {e}")
+            self.logger.error(f"Failed to capture photo: {e}")
             raise
-        except (
-            Exception
-        ) as e:  # Catch other unexpected errors like permission issues for cv2.imwrite
-            self.logger.error(f"Unexpected error during photo capture/save: {e}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error during photo capture: {e}")
             raise SensorCaptureError(
-                f"Unexpected error during photo capture/save: {e}"
+                f"Unexpected error during photo capture: {e}"
             ) from e
 
+        timestamp = time.time()
+
+        file_path = time.strftime(self._filename_fmt, time.localtime(timestamp))
+
+        reading = ImageReading(
+            image=image_data, timestamp=timestamp, file_path=file_path
+        )
+        self._last_capture = reading
+        return reading
+
+    def save(self, image: np.ndarray, file_path: str) -> None:
+        """
+        Encode an image and write it to disk.
+
+        Safe to call from a worker thread; OpenCV releases the GIL while
+        encoding.
+
+        Args:
+            image: Image data as returned by capture().
+            file_path: Destination path for the encoded image.
+        Raises:
+            SensorCaptureError if saving fails.
+        """
+        try:
+            if self._jpeg_encode is not None:
+                data: Any = self._jpeg_encode(image)
+                success = True
+            else:
+                success, data = cv2.imencode(
+                    self._file_ext, image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+                )
+            if success:
+                self._write_file(file_path, data)
+        except Exception as e:  # e.g. permission issues opening file_path
+            self.logger.error(f"Unexpected error during photo save: {e}")
+            raise SensorCaptureError(f"Unexpected error during photo save: {e}") from e
+
+        if not success:
+            self.logger.error(f"Failed to save image to {file_path}")
+            raise SensorCaptureError(f"Failed to save image to {file_path}")
+
+        self.logger.debug(f"Photo saved to {file_path}")
+
+    @staticmethod
+    def _write_file(file_path: str, data: Any) -> None:
+        """
+        Write an encoded image with a single write() on a raw file descriptor.
+
+        The data goes to a temporary file that is then renamed over file_path,
+        so readers never see a partially written photo. Each write gets its
+        own temporary file, since photos taken in the same second share a
+        name and may be saved by different writer threads at once.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+        try:
+            try:
+                os.chmod(tmp_path, 0o644)  # mkstemp creates it owner-only
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def capture_and_save_photo(self, wait: bool = False) -> ImageReading:
+        """
+        Capture a photo and save it to the configured directory.
+
+        By default the save is queued for the writer threads and this returns
+        as soon as the photo is captured; the file appears at the reading's
+        file_path shortly after. Errors from a queued save are logged and
+        passed to on_save_error. If the writer falls behind, the oldest
+        queued photo is dropped and counted in dropped_photos.
+
+        Args:
+            wait: Save on the calling thread and raise any save error.
+        Returns:
+            ImageReading object with image data and file path.
+        Raises:
+            SensorCaptureError if capturing (or, with wait, saving) fails.
+        """
+        reading = self.capture()
+        if reading.file_path:
+            if wait:
+                self.save(reading.image, reading.file_path)
+            else:
+                _PHOTO_WRITER.submit(self, reading.image, reading.file_path)
+        return reading
+
     def get_last_capture(self) -> Optional[ImageReading]:
         """Get the last captured image data."""
         return self._last_capture
 
     def is_healthy(self) -> bool:
-        """Check if the webcam sensor is healthy."""
+        """
+        Check if the webcam sensor is healthy.
+
+        After several consecutive failed checks the adapter is reopened, so a
+        briefly stalled camera isn't reset by a single check.
+        """
         if not hasattr(self, "adapter") or not self.adapter:
             return False
-        return self.adapter.is_healthy()
+        if self.adapter.is_healthy():
+            self._failed_health_checks = 0
+            return True
+
+        self._failed_health_checks += 1
+        if self._failed_health_checks < _RECOVER_AFTER_CHECKS:
+            return False
+        self._failed_health_checks = 0
+        self.logger.warning(
+            f"Webcam {self.camera_id} unhealthy for {_RECOVER_AFTER_CHECKS} "
+            "checks. Attempting re-init."
+        )
+        try:
+            return self.adapter.recover()
+        except (SensorConfigError, SensorCaptureError) as e:
+            self.logger.error(f"Webcam {self.camera_id} recovery failed: {e}")
+            return False
 
     def release(self) -> None:
-        """Release the webcam adapter."""
+        """Release the webcam adapter, after pending photos are saved."""
+        if self._writer_held:
+            self._writer_held = False
+            _PHOTO_WRITER.release(self)
         if hasattr(self, "adapter") and self.adapter:
             self.adapter.release()
         self.logger.info("WebcamSensor resources released.")
 
     def get_status(self) -> Dict[str, Any]:
         """Get status information about the webcam sensor."""
-        last_capture_info = None
-        if self._last_capture:
-            last_capture_info = {
-                "timestamp": self._last_capture.timestamp,
-                "file_path": self._last_capture.file_path,
-                "image_shape": (
-                    self._last_capture.image.shape
-                    if self._last_capture.image is not None
-                    else None
-                ),
-            }
-
-        return {
-            "sensor_type": "webcam_c270",  # Or a more generic "webcam"
-            "camera_id": self.camera_id,
-            "resolution": self.resolution,
-            "output_directory": self.output_directory,
-            "file_format": self.file_format,
-            "mode": "production" if self.production else "development",
-            "healthy": self.is_healthy(),
-            "last_capture": last_capture_info,
-        }
+        status = self._static_status.copy()
+        # The adapter's own verdict: reading status must not count towards,
+        # or trigger, the camera recovery that is_healthy() performs
+        status["healthy"] = self.adapter.is_healthy()
+        status["fps"] = self.adapter.frame_rate()
+        status["dropped_frames"] = self.dropped_photos
+        status["last_capture"] = None
+
+        capture = self._last_capture
+        if capture:
+            cached = self._capture_status
+            if cached is None or cached[0] is not capture:
+                cached = self._capture_status = (
+                    capture,
+                    {
+                        "timestamp": capture.timestamp,
+                        "file_path": capture.file_path,
+                        "image_shape": (
+                            capture.image.shape if capture.image is not None else None
+                        ),
+                    },
+                )
+            status["last_capture"] = cached[1]
+        return status
@@ -0,0 +1,31 @@
+"""
+Shared pytest setup for the test suite.
+
+Puts the src directory on the Python path once, before any test module is
+imported, so the tests can import runners and sensors directly.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(scope="class")
+def simulated_monitor(request):
+    """
+    Give a test class one simulated monitor, built from its class attributes.
+
+    The class sets monitor_class and test_config. Tests that only inspect the
+    monitor use self.shared_monitor; tests that depend on its reading history
+    build their own with self.fresh_monitor().
+    """
+    cls = request.cls
+
+    def fresh_monitor():
+        return cls.monitor_class(cls.test_config, production=False)
+
+    cls.fresh_monitor = staticmethod(fresh_monitor)
+    cls.shared_monitor = fresh_monitor()
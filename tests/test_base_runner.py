@@ -5,14 +5,11 @@ This module contains comprehensive unit tests for the BaseRunner abstract class
 and its concrete implementations.
 """
 
-# Add parent directory to path for imports
-import sys
+import dataclasses
+import threading
 import time
 import unittest
-from pathlib import Path
-from typing import Any, Dict
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from typing import Any, Callable, Dict
 
 from runners.base_runner import BaseRunner, RunnerState, RunnerStatus
 
@@ -27,16 +24,31 @@ class ConcreteRunner(BaseRunner):
         self.cleanup_called = False
         self.should_fail_init = False
         self.should_fail_work = False
+        # Notified after every work cycle and recorded error, so tests can
+        # wait for the runner thread instead of sleeping
+        self._progress = threading.Condition()
 
     def _initialize(self) -> bool:
         self.initialize_called = True
         return not self.should_fail_init
 
     def _work_cycle(self) -> None:
-        self.work_cycle_count += 1
+        with self._progress:
+            self.work_cycle_count += 1
+            self._progress.notify_all()
         if self.should_fail_work:
             raise RuntimeError("Test work cycle error")
 
+    def _record_error(self, error_msg: str) -> None:
+        super()._record_error(error_msg)
+        with self._progress:
+            self._progress.notify_all()
+
+    def wait_for(self, predicate: Callable[[], bool], timeout: float = 2.0) -> bool:
+        """Wait until predicate() holds after a work cycle or error."""
+        with self._progress:
+            return self._progress.wait_for(predicate, timeout)
+
     def is_healthy(self) -> bool:
         return self.work_cycle_count > 0 and not self.should_fail_work
 
@@ -47,22 +59,23 @@ class ConcreteRunner(BaseRunner):
 class TestBaseRunner(unittest.TestCase):
     """Test cases for BaseRunner functionality."""
 
+    config = {"enabled": True, "measurement_interval": 0.001}
+
     def setUp(self):
         """Set up test fixtures."""
-        self.config = {"enabled": True, "measurement_interval": 0.1}
         self.runner = ConcreteRunner("test_runner", self.config)
 
-    def tearDown(self):
-        """Clean up after tests."""
-        if self.runner.is_running:
-            self.runner.stop()
+    def _start_runner(self) -> bool:
+        """Start the runner, and stop it again when the test ends."""
+        self.addCleanup(self.runner.stop)
+        return self.runner.start()
 
     def test_initialization(self):
         """Test runner initialization."""
         self.assertEqual(self.runner.name, "test_runner")
         self.assertEqual(self.runner.state, RunnerState.STOPPED)
         self.assertTrue(self.runner.enabled)
-        self.assertEqual(self.runner.interval, 0.1)
+        self.assertEqual(self.runner.interval, 0.001)
         self.assertFalse(self.runner.initialize_called)
 
     def test_enable_disable(self):
@@ -77,21 +90,26 @@ class TestBaseRunner(unittest.TestCase):
 
     def test_start_stop(self):
         """Test starting and stopping the runner."""
-        # Start the runner
-        self.assertTrue(self.runner.start())
+        observed = []
+
+        def observe(result):
+            observed.append((result, self.runner.state, self.runner.is_running))
+
+        # Start the runner, wait for a work cycle, then stop it
+        observe(self._start_runner())
+        observe(self.runner.wait_for(lambda: self.runner.work_cycle_count > 0))
+        observe(self.runner.stop())
+
+        self.assertEqual(
+            observed,
+            [
+                (True, RunnerState.RUNNING, True),
+                (True, RunnerState.RUNNING, True),
+                (True, RunnerState.STOPPED, False),
+            ],
+        )
         self.assertTrue(self.runner.initialize_called)
-        self.assertEqual(self.runner.state, RunnerState.RUNNING)
-        self.assertTrue(self.runner.is_running)
-
-        # Wait for some work cycles
-        time.sleep(0.3)
-        self.assertGreater(self.runner.work_cycle_count, 0)
-
-        # Stop the runner
-        self.assertTrue(self.runner.stop())
         self.assertTrue(self.runner.cleanup_called)
-        self.assertEqual(self.runner.state, RunnerState.STOPPED)
-        self.assertFalse(self.runner.is_running)
 
     def test_start_when_disabled(self):
         """Test starting a disabled runner."""
@@ -101,7 +119,7 @@ class TestBaseRunner(unittest.TestCase):
 
     def test_double_start(self):
         """Test starting an already running runner."""
-        self.assertTrue(self.runner.start())
+        self.assertTrue(self._start_runner())
         self.assertFalse(self.runner.start())  # Should fail
 
     def test_initialization_failure(self):
@@ -112,12 +130,13 @@ class TestBaseRunner(unittest.TestCase):
 
     def test_work_cycle_error_handling(self):
         """Test error handling in work cycle."""
-        self.assertTrue(self.runner.start())
-        time.sleep(0.2)  # Let it run normally
+        self.assertTrue(self._start_runner())
+        # Let it run normally
+        self.assertTrue(self.runner.wait_for(lambda: self.runner.work_cycle_count > 0))
 
         # Introduce error
         self.runner.should_fail_work = True
-        time.sleep(0.2)  # Let error occur
+        self.assertTrue(self.runner.wait_for(lambda: self.runner._error_count > 0))
 
         # Runner should continue running (default error handling)
         self.assertTrue(self.runner.is_running)
@@ -126,8 +145,8 @@ class TestBaseRunner(unittest.TestCase):
 
     def test_get_status(self):
         """Test status reporting."""
-        self.runner.start()
-        time.sleep(0.2)
+        self._start_runner()
+        self.assertTrue(self.runner.wait_for(lambda: self.runner.work_cycle_count > 0))
 
         status = self.runner.get_status()
         self.assertEqual(status.name, "test_runner")
@@ -141,18 +160,45 @@ class TestBaseRunner(unittest.TestCase):
 
         self.runner.stop()
 
+    def test_health_listener_notified_on_change(self):
+        """Test health listeners are called only when health changes."""
+        changes = []
+        self.runner.add_health_listener(
+            lambda name, healthy: changes.append((name, healthy))
+        )
+
+        # Step the runner's cycles directly, without starting its thread
+        for _ in range(3):  # Several healthy work cycles
+            self.assertTrue(self.runner._run_cycle())
+        self.assertEqual(changes, [("test_runner", True)])
+
+        self.runner.should_fail_work = True
+        self.assertFalse(self.runner._run_cycle())  # Let error occur
+        self.assertEqual(changes, [("test_runner", True), ("test_runner", False)])
+        self.assertEqual(self.runner._error_count, 1)
+
+    def test_unhandled_work_cycle_error_stops_runner(self):
+        """Test a cycle error _handle_error() rejects signals the thread to stop."""
+        self.runner.should_fail_work = True
+        self.runner._handle_error = lambda error: False
+        self.assertFalse(self.runner._run_cycle())
+        self.assertTrue(self.runner._stop_event.is_set())
+
     def test_graceful_shutdown_timeout(self):
         """Test graceful shutdown with timeout."""
 
+        release_cleanup = threading.Event()
+
         # Create a runner that takes time to stop
         class SlowRunner(ConcreteRunner):
             def _cleanup(self):
-                time.sleep(2)  # Simulate slow cleanup
+                release_cleanup.wait(2)  # Simulate slow cleanup
                 super()._cleanup()
 
         slow_runner = SlowRunner("slow", self.config)
+        self.addCleanup(release_cleanup.set)
         slow_runner.start()
-        time.sleep(0.1)
+        self.assertTrue(slow_runner.wait_for(lambda: slow_runner.work_cycle_count > 0))
 
         # Try to stop with short timeout
         start_time = time.time()
@@ -180,6 +226,8 @@ class TestRunnerStateEnum(unittest.TestCase):
 class TestRunnerStatus(unittest.TestCase):
     """Test cases for RunnerStatus dataclass."""
 
+    LAST_ACTIVITY = 1_700_000_000.0
+
     def test_status_creation(self):
         """Test creating a RunnerStatus instance."""
         status = RunnerStatus(
@@ -190,17 +238,22 @@ class TestRunnerStatus(unittest.TestCase):
             error_count=0,
             last_error=None,
             uptime=10.5,
-            last_activity=time.time(),
+            last_activity=self.LAST_ACTIVITY,
         )
 
-        self.assertEqual(status.name, "test")
-        self.assertEqual(status.state, RunnerState.RUNNING)
-        self.assertTrue(status.enabled)
-        self.assertTrue(status.healthy)
-        self.assertEqual(status.error_count, 0)
-        self.assertIsNone(status.last_error)
-        self.assertEqual(status.uptime, 10.5)
-        self.assertIsNotNone(status.last_activity)
+        self.assertEqual(
+            dataclasses.asdict(status),
+            {
+                "name": "test",
+                "state": RunnerState.RUNNING,
+                "enabled": True,
+                "healthy": True,
+                "error_count": 0,
+                "last_error": None,
+                "uptime": 10.5,
+                "last_activity": self.LAST_ACTIVITY,
+            },
+        )
 
 
 if __name__ == "__main__":
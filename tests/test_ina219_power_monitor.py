@@ -5,60 +5,61 @@ Unit tests for INA219 Power Monitor
 Tests both development (simulated) and production modes of the power monitor.
 """
 
+import json
 import sys
 import unittest
-from pathlib import Path
 from unittest.mock import MagicMock, patch  # For mocking hardware
 
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import numpy as np
+import pytest
 
-# Now import from sensors, including the new error type
 from sensors import INA219PowerMonitor
 from sensors.ina219_power_monitor import (
+    HardwareINA219Adapter,
     PowerReading,
     SensorReadError,
     SimulatedINA219Adapter,
 )
 
 
+@pytest.mark.usefixtures("simulated_monitor")
 class TestINA219PowerMonitorDevelopment(unittest.TestCase):
     """Test cases for INA219 Power Monitor in Development Mode (Simulated)."""
 
-    def setUp(self):
-        """Set up test configuration for development mode."""
-        self.test_config = {
-            "ina219": {
-                "i2c_address": 0x40,
-                "measurement_interval": 0.1,  # Fast for testing
-                "log_measurements": False,  # Quiet for testing
-                "low_power_threshold": 0.5,
-                "high_power_threshold": 10.0,
-            }
+    monitor_class = INA219PowerMonitor
+    test_config = {
+        "ina219": {
+            "i2c_address": 0x40,
+            "measurement_interval": 0.1,  # Fast for testing
+            "log_measurements": False,  # Quiet for testing
+            "low_power_threshold": 0.5,
+            "high_power_threshold": 10.0,
         }
-        # In development mode, it uses SimulatedINA219Adapter
-        self.monitor = INA219PowerMonitor(self.test_config, production=False)
+    }
 
     def test_development_mode_initialization(self):
         """Test initialization in development mode."""
-        self.assertIsNotNone(self.monitor)
-        self.assertFalse(self.monitor.production)
-        self.assertEqual(self.monitor.i2c_address, 0x40)
-        self.assertIsInstance(self.monitor.sensor_adapter, SimulatedINA219Adapter)
+        self.assertIsNotNone(self.shared_monitor)
+        self.assertFalse(self.shared_monitor.production)
+        self.assertEqual(self.shared_monitor.i2c_address, 0x40)
+        self.assertIsInstance(
+            self.shared_monitor.sensor_adapter, SimulatedINA219Adapter
+        )
 
     def test_development_mode_readings(self):
         """Test taking readings in development mode."""
+        monitor = self.fresh_monitor()
         # Test individual readings
-        voltage = self.monitor.read_voltage()
-        current = self.monitor.read_current()
-        power = self.monitor.read_power()
+        voltage = monitor.read_voltage()
+        current = monitor.read_current()
+        power = monitor.read_power()
 
         self.assertGreater(voltage, 0)
         self.assertGreater(current, 0)
         self.assertGreater(power, 0)
 
         # Test complete reading
-        reading = self.monitor.get_reading()
+        reading = monitor.get_reading()
         self.assertIsNotNone(reading)
         self.assertIsInstance(reading, PowerReading)
         self.assertGreater(reading.voltage, 0)
@@ -66,15 +67,65 @@ class TestINA219PowerMonitorDevelopment(unittest.TestCase):
         self.assertGreater(reading.power, 0)
         self.assertIsNotNone(reading.timestamp)
 
+    def test_get_reading_memoized_within_interval(self):
+        """Test get_reading() reuses a fresh reading unless forced."""
+        monitor = self.fresh_monitor()
+        reading = monitor.get_reading()
+        with patch.object(monitor, "_read_all") as mock_read_all:
+            mock_read_all.return_value = (12.1, 1.5, 12.1 * 1.5)
+            self.assertIs(monitor.get_reading(), reading)
+            mock_read_all.assert_not_called()
+
+            forced = monitor.get_reading(force=True)
+            mock_read_all.assert_called_once()
+            self.assertEqual(forced.voltage, 12.1)
+
     def test_health_check_development(self):
         """Test sensor health checking in development mode."""
         # Should be healthy in development mode with simulated adapter
-        self.assertTrue(self.monitor.is_healthy())
+        self.assertTrue(self.shared_monitor.is_healthy())
+
+    def test_health_check_reuses_fresh_reading(self):
+        """Test health and status checks don't re-read a fresh reading."""
+        monitor = self.fresh_monitor()
+        monitor.get_reading()
+        with patch.object(monitor, "_read_all") as mock_read_all:
+            self.assertTrue(monitor.is_healthy())
+            self.assertTrue(monitor.get_status()["healthy"])
+            mock_read_all.assert_not_called()
+
+    def test_get_readings_batch_development(self):
+        """Test get_readings() returns a structured batch of simulated readings."""
+        monitor = self.fresh_monitor()
+        readings = monitor.get_readings(500)
+
+        self.assertEqual(readings.shape, (500,))
+        self.assertEqual(
+            readings.dtype.names, ("voltage", "current", "power", "timestamp")
+        )
+        self.assertTrue(
+            ((readings["voltage"] >= 11.7) & (readings["voltage"] <= 12.3)).all()
+        )
+        self.assertTrue(
+            ((readings["current"] >= 0.2) & (readings["current"] <= 1.2)).all()
+        )
+        np.testing.assert_allclose(
+            readings["power"], readings["voltage"] * readings["current"]
+        )
+        self.assertIsNone(monitor.get_last_reading())
+
+    def test_health_verdict_cached_from_reading(self):
+        """Test is_healthy() returns the verdict computed by the last reading."""
+        monitor = self.fresh_monitor()
+        monitor.get_reading()
+        with patch.object(monitor, "_evaluate_health") as mock_evaluate:
+            self.assertTrue(monitor.is_healthy())
+            mock_evaluate.assert_not_called()
 
     def test_status_reporting_development(self):
         """Test status reporting functionality in development mode."""
-        self.monitor.get_reading()  # Take a reading first
-        status = self.monitor.get_status()
+        self.shared_monitor.get_reading()  # Take a reading first
+        status = self.shared_monitor.get_status()
 
         self.assertEqual(status["sensor_type"], "INA219")
         self.assertEqual(status["i2c_address"], "0x40")
@@ -84,61 +135,109 @@ class TestINA219PowerMonitorDevelopment(unittest.TestCase):
         self.assertIn("voltage", status["last_reading"])
         self.assertIn("thresholds", status)
 
+    def test_status_json_cached_until_next_reading(self):
+        """Test get_status_json() serializes once per reading."""
+        monitor = self.fresh_monitor()
+        monitor.get_reading()
+        payload = monitor.get_status_json()
+        self.assertIs(monitor.get_status_json(), payload)
+        self.assertEqual(json.loads(payload), monitor.get_status())
+
+        monitor.get_reading(force=True)
+        self.assertIsNot(monitor.get_status_json(), payload)
+
     def test_last_reading_retrieval_development(self):
         """Test retrieving the last reading in development mode."""
-        self.assertIsNone(self.monitor.get_last_reading())  # Initially None
-        reading1 = self.monitor.get_reading()
-        reading2 = self.monitor.get_last_reading()
+        monitor = self.fresh_monitor()
+        self.assertIsNone(monitor.get_last_reading())  # Initially None
+        reading1 = monitor.get_reading()
+        reading2 = monitor.get_last_reading()
         self.assertIsNotNone(reading2)
         self.assertEqual(reading1.timestamp, reading2.timestamp)
         self.assertEqual(reading1.voltage, reading2.voltage)
 
     def test_configuration_parsing(self):
-        """Test configuration parameter parsing (applies to both modes)."""
-        custom_config = {
-            "ina219": {
-                "i2c_address": 0x41,
-                "measurement_interval": 2.0,
-                "log_measurements": True,
-                "low_power_threshold": 1.0,
-                "high_power_threshold": 20.0,
-            }
+        """Test configuration parsing and defaults (applies to both modes)."""
+        cases = [
+            (
+                {
+                    "ina219": {
+                        "i2c_address": 0x41,
+                        "measurement_interval": 2.0,
+                        "log_measurements": True,
+                        "low_power_threshold": 1.0,
+                        "high_power_threshold": 20.0,
+                    }
+                },
+                {
+                    "i2c_address": 0x41,
+                    "measurement_interval": 2.0,
+                    "log_measurements": True,
+                    "low_power_threshold": 1.0,
+                    "high_power_threshold": 20.0,
+                },
+            ),
+            (
+                {},  # Empty config falls back to the defaults
+                {
+                    "i2c_address": 0x40,
+                    "measurement_interval": 1.0,
+                    "log_measurements": True,
+                    "low_power_threshold": 0.5,
+                    "high_power_threshold": 10.0,
+                },
+            ),
+        ]
+        for config, expected in cases:
+            monitor = INA219PowerMonitor(config, production=False)
+            for attr, value in expected.items():
+                with self.subTest(config=config, attr=attr):
+                    self.assertEqual(getattr(monitor, attr), value)
+
+
+class TestINA219PowerMonitorProductionMocked(unittest.TestCase):
+    """Test cases for INA219 Power Monitor in Production Mode (Mocked Adapter)."""
+
+    test_config = {
+        "ina219": {
+            "i2c_address": 0x40,  # A common default
+            "log_measurements": False,
         }
-        monitor = INA219PowerMonitor(custom_config, production=False)
-        self.assertEqual(monitor.i2c_address, 0x41)
-        self.assertEqual(monitor.measurement_interval, 2.0)
-        self.assertTrue(monitor.log_measurements)
-        self.assertEqual(monitor.low_power_threshold, 1.0)
-        self.assertEqual(monitor.high_power_threshold, 20.0)
-
-    def test_missing_config_defaults(self):
-        """Test default values when configuration is missing (applies to both modes)."""
-        monitor = INA219PowerMonitor({}, production=False)  # Empty config
-        self.assertEqual(monitor.i2c_address, 0x40)
-        self.assertEqual(monitor.measurement_interval, 1.0)
-        self.assertTrue(monitor.log_measurements)
-        self.assertEqual(monitor.low_power_threshold, 0.5)
-        self.assertEqual(monitor.high_power_threshold, 10.0)
-
+    }
+
+    # Adapter reads for 12.1V at 1.5A; get_reading() fetches all three values
+    # in one read_all() call
+    ADAPTER_READINGS = {
+        "read_voltage.return_value": 12.1,  # V
+        "read_current_ma.return_value": 1500.0,  # mA
+        "read_power_mw.return_value": 12.1 * 1500.0,  # mW
+        "read_all.return_value": (12.1, 1.5, 12.1 * 1.5),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Replace the hardware adapter once for every test in the class."""
+        # autospec keeps the mock in step with the real adapter's methods
+        cls.adapter_patcher = patch(
+            "sensors.ina219_power_monitor.HardwareINA219Adapter", autospec=True
+        )
+        cls.MockHardwareAdapter = cls.adapter_patcher.start()
 
-class TestINA219PowerMonitorProduction(unittest.TestCase):
-    """Test cases for INA219 Power Monitor in Production Mode (Hardware)."""
+    @classmethod
+    def tearDownClass(cls):
+        cls.adapter_patcher.stop()
 
     def setUp(self):
-        self.test_config = {
-            "ina219": {
-                "i2c_address": 0x40,  # A common default
-                "log_measurements": False,
-            }
-        }
+        # Forget calls and values configured on the adapter by earlier tests
+        self.MockHardwareAdapter.reset_mock()
+        self.MockHardwareAdapter.return_value.reset_mock(
+            return_value=True, side_effect=True
+        )
 
-    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter")
-    def test_production_mode_initialization_successful_mocked(
-        self, MockHardwareAdapter
-    ):
+    def test_production_mode_initialization_successful_mocked(self):
         """Test initialization in production mode with mocked hardware adapter."""
         # Create a mock adapter instance
-        mock_adapter_instance = MockHardwareAdapter.return_value
+        mock_adapter_instance = self.MockHardwareAdapter.return_value
         mock_adapter_instance.sensor = MagicMock()  # Mock sensor is set
         mock_adapter_instance.initialize.return_value = None  # initialize() succeeds
 
@@ -146,33 +245,28 @@ class TestINA219PowerMonitorProduction(unittest.TestCase):
         self.assertIsNotNone(monitor)
         self.assertTrue(monitor.production)
 
-        # Verify the adapter was created with the correct i2c address
-        MockHardwareAdapter.assert_called_once_with(0x40)
+        # Verify the adapter was created with the correct i2c address, bus and
+        # default ADC settings
+        self.MockHardwareAdapter.assert_called_once_with(
+            0x40,
+            1,
+            calibration="32V_2A",
+            adc_resolution="12BIT_1S",
+            bus_voltage_range=None,
+        )
         # Verify initialize was called
         mock_adapter_instance.initialize.assert_called_once()
         # Verify the adapter is set
         self.assertEqual(monitor.sensor_adapter, mock_adapter_instance)
 
-    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter._initialize_sensor")
-    def test_production_mode_initialization_failure_mocked(self, mock_init_sensor):
-        """Test initialization failure in production mode with mocked hardware error."""
-        mock_init_sensor.side_effect = SensorReadError("Mocked hardware init failure")
-        with self.assertRaises(SensorReadError):
-            INA219PowerMonitor(self.test_config, production=True)
-        mock_init_sensor.assert_called_once()
-
-    # Mocking the entire HardwareINA219Adapter for read tests
-    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter")
-    def test_production_mode_readings_mocked(self, MockHardwareAdapter):
+    def test_production_mode_readings_mocked(self):
         """Test taking readings in production mode with mocked hardware adapter."""
-        mock_adapter_instance = MockHardwareAdapter.return_value
-        mock_adapter_instance.read_voltage.return_value = 12.1  # V
-        mock_adapter_instance.read_current_ma.return_value = 1500.0  # mA
-        mock_adapter_instance.read_power_mw.return_value = 12.1 * 1500.0  # mW
+        mock_adapter_instance = self.MockHardwareAdapter.return_value
+        mock_adapter_instance.configure_mock(**self.ADAPTER_READINGS)
 
         monitor = INA219PowerMonitor(self.test_config, production=True)
         # Ensure our mock is actually used
-        self.assertIsInstance(monitor.sensor_adapter, MagicMock)
+        self.assertIs(monitor.sensor_adapter, mock_adapter_instance)
 
         voltage = monitor.read_voltage()
         current = monitor.read_current()
@@ -189,14 +283,17 @@ class TestINA219PowerMonitorProduction(unittest.TestCase):
         reading = monitor.get_reading()
         self.assertEqual(reading.voltage, 12.1)
         self.assertEqual(reading.current, 1.5)
+        mock_adapter_instance.read_all.assert_called_once()
 
-    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter")
-    def test_production_mode_read_failure_mocked(self, MockHardwareAdapter):
+    def test_production_mode_read_failure_mocked(self):
         """Test sensor read failure in production mode with mocked adapter."""
-        mock_adapter_instance = MockHardwareAdapter.return_value
+        mock_adapter_instance = self.MockHardwareAdapter.return_value
         mock_adapter_instance.read_voltage.side_effect = SensorReadError(
             "Mocked voltage read error"
         )
+        mock_adapter_instance.read_all.side_effect = SensorReadError(
+            "Mocked voltage read error"
+        )
 
         monitor = INA219PowerMonitor(self.test_config, production=True)
 
@@ -207,6 +304,104 @@ class TestINA219PowerMonitorProduction(unittest.TestCase):
         with self.assertRaises(SensorReadError):  # get_reading should also fail
             monitor.get_reading()
 
+
+class TestINA219PowerMonitorProduction(unittest.TestCase):
+    """Test cases for INA219 Power Monitor in Production Mode (Hardware)."""
+
+    test_config = {
+        "ina219": {
+            "i2c_address": 0x40,  # A common default
+            "log_measurements": False,
+        }
+    }
+
+    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter._initialize_sensor")
+    def test_production_mode_initialization_failure_mocked(self, mock_init_sensor):
+        """Test initialization failure in production mode with mocked hardware error."""
+        mock_init_sensor.side_effect = SensorReadError("Mocked hardware init failure")
+        with self.assertRaises(SensorReadError):
+            INA219PowerMonitor(self.test_config, production=True)
+        mock_init_sensor.assert_called_once()
+
+    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter._initialize_sensor")
+    def test_hardware_read_all_single_transaction(self, mock_init_sensor):
+        """Test read_all() reads and scales all registers under one bus lock."""
+        registers = {
+            0x02: (12000 // 4) << 3,  # 12.0V bus voltage, 4mV per bit
+            0x04: 0x10000 - 5000,  # -500mA with 0.1mA per bit
+            0x03: 3000,  # 2mW per bit
+        }
+
+        def write_then_readinto(out_buffer, in_buffer):
+            value = registers[out_buffer[0]]
+            in_buffer[0], in_buffer[1] = value >> 8, value & 0xFF
+
+        adapter = HardwareINA219Adapter(0x40)
+        adapter.sensor = MagicMock(_cal_value=4096, _current_lsb=0.1, _power_lsb=2)
+        i2c = adapter.sensor.i2c_device.__enter__.return_value
+        i2c.write_then_readinto.side_effect = write_then_readinto
+
+        voltage, current, power = adapter.read_all()
+
+        self.assertAlmostEqual(voltage, 12.0)
+        self.assertAlmostEqual(current, -0.5)
+        self.assertAlmostEqual(power, 6.0)
+        adapter.sensor.i2c_device.__enter__.assert_called_once()
+        i2c.write.assert_called_once_with(bytes([0x05, 0x10, 0x00]))
+
+    @patch("sensors.ina219_power_monitor.HardwareINA219Adapter._initialize_sensor")
+    def test_hardware_read_all_smbus_word_reads(self, mock_init_sensor):
+        """Test read_all() byte-swaps SMBus words when smbus2 is available."""
+        registers = {
+            0x02: (12000 // 4) << 3,  # 12.0V bus voltage, 4mV per bit
+            0x04: 0x10000 - 5000,  # -500mA with 0.1mA per bit
+            0x03: 3000,  # 2mW per bit
+        }
+
+        def read_word_data(address, register):
+            value = registers[register]  # SMBus words arrive little-endian
+            return ((value & 0xFF) << 8) | (value >> 8)
+
+        adapter = HardwareINA219Adapter(0x40)
+        adapter.sensor = MagicMock(_cal_value=4096, _current_lsb=0.1, _power_lsb=2)
+        adapter._smbus = MagicMock()
+        adapter._smbus.read_word_data.side_effect = read_word_data
+
+        voltage, current, power = adapter.read_all()
+
+        self.assertAlmostEqual(voltage, 12.0)
+        self.assertAlmostEqual(current, -0.5)
+        self.assertAlmostEqual(power, 6.0)
+        adapter._smbus.write_word_data.assert_called_once_with(0x40, 0x05, 0x0010)
+        adapter.sensor.i2c_device.__enter__.assert_not_called()
+
+    @patch("sensors.ina219_power_monitor._I2C_BUS", None)
+    def test_i2c_bus_shared_between_adapters(self):
+        """Test the busio I2C bus is opened once and reused."""
+        mock_busio = MagicMock()
+        mock_ina219 = MagicMock()
+        with patch.dict(
+            sys.modules,
+            {
+                "board": MagicMock(),
+                "busio": mock_busio,
+                "adafruit_ina219": mock_ina219,
+                "smbus2": None,  # Force the busio read path
+            },
+        ):
+            HardwareINA219Adapter(0x40)
+            HardwareINA219Adapter(0x41)
+
+        mock_busio.I2C.assert_called_once()
+        sensor = mock_ina219.INA219.return_value
+        sensor.set_calibration_32V_2A.assert_called_with()
+        self.assertEqual(
+            sensor.bus_adc_resolution, mock_ina219.ADCResolution.ADCRES_12BIT_1S
+        )
+        bus = mock_busio.I2C.return_value
+        mock_ina219.INA219.assert_any_call(bus, addr=0x40)
+        mock_ina219.INA219.assert_any_call(bus, addr=0x41)
+
     @patch("sensors.ina219_power_monitor.HardwareINA219Adapter._initialize_sensor")
     def test_health_check_production_unhealthy_on_init_fail(self, mock_init_sensor):
         """Test health check is False if hardware init fails."""
@@ -222,11 +417,11 @@ class TestINA219PowerMonitorProduction(unittest.TestCase):
 class TestINA219PowerReadingDataClass(unittest.TestCase):
     """Test cases for PowerReading data class (unchanged by adapter refactor)."""
 
+    TIMESTAMP = 1_700_000_000.0
+
     def test_power_reading_creation(self):
         """Test PowerReading data class creation."""
-        import time  # Ensure time is imported for this test
-
-        timestamp = time.time()
+        timestamp = self.TIMESTAMP
         reading = PowerReading(
             voltage=12.5, current=1.25, power=15.625, timestamp=timestamp
         )
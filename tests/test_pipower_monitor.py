@@ -5,14 +5,15 @@ Unit tests for PiPower Monitor
 Tests both development (simulated) and production modes of the power monitor.
 """
 
+import itertools
 import sys
+import threading
 import time
+import traceback
 import unittest
-from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from sensors.pipower_monitor import (
     HardwarePiPowerAdapter,
@@ -23,47 +24,60 @@ from sensors.pipower_monitor import (
 )
 
 
+def wait_until(predicate, timeout=2.0):
+    """Poll predicate() until it is true; return False after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+@pytest.mark.usefixtures("simulated_monitor")
 class TestPiPowerMonitorDevelopment(unittest.TestCase):
     """Test cases for PiPower Monitor in Development Mode (Simulated)."""
 
-    def setUp(self):
-        """Set up test configuration for development mode."""
-        self.test_config = {
-            "pipower": {
-                "log_readings": False,  # Quiet for testing
-                "bt_lv_pin": 17,
-                "adc_channel": 0,
-                "in_dt_pin": 18,
-                "chg_pin": 27,
-                "lo_dt_pin": 22,
-            }
+    monitor_class = PiPowerMonitor
+    test_config = {
+        "pipower": {
+            "log_readings": False,  # Quiet for testing
+            "bt_lv_pin": 17,
+            "adc_channel": 0,
+            "in_dt_pin": 18,
+            "chg_pin": 27,
+            "lo_dt_pin": 22,
         }
-        # In development mode, it uses SimulatedPiPowerAdapter
-        self.monitor = PiPowerMonitor(self.test_config, production=False)
+    }
 
     def test_development_mode_initialization(self):
         """Test initialization in development mode."""
-        self.assertIsNotNone(self.monitor)
-        self.assertFalse(self.monitor.production)
-        self.assertIsInstance(self.monitor.sensor_adapter, SimulatedPiPowerAdapter)
-        self.assertEqual(self.monitor.pins["BT_LV"], 17)
-        self.assertEqual(self.monitor.pins["IN_DT"], 18)
-        self.assertEqual(self.monitor.pins["CHG"], 27)
-        self.assertEqual(self.monitor.pins["LO_DT"], 22)
-        self.assertEqual(self.monitor.adc_channel, 0)
+        self.assertIsNotNone(self.shared_monitor)
+        self.assertFalse(self.shared_monitor.production)
+        self.assertIsInstance(
+            self.shared_monitor.sensor_adapter, SimulatedPiPowerAdapter
+        )
+        self.assertEqual(self.shared_monitor.pins["BT_LV"], 17)
+        self.assertEqual(self.shared_monitor.pins["IN_DT"], 18)
+        self.assertEqual(self.shared_monitor.pins["CHG"], 27)
+        self.assertEqual(self.shared_monitor.pins["LO_DT"], 22)
+        self.assertEqual(self.shared_monitor.adc_channel, 0)
 
     def test_development_mode_readings(self):
         """Test taking readings in development mode."""
-        reading = self.monitor.get_reading()
+        reading = self.shared_monitor.get_reading()
         self.assertIsNotNone(reading)
         self.assertIsInstance(reading, PiPowerReading)
 
         # Check all fields are present and of correct type
         self.assertIsInstance(reading.battery_voltage, float)
-        self.assertIsInstance(reading.is_usb_power_input, bool)
-        self.assertIsInstance(reading.is_charging, bool)
-        self.assertIsInstance(reading.is_low_battery, bool)
-        self.assertIsInstance(reading.timestamp, float)
+        flags = (
+            reading.is_usb_power_input,
+            reading.is_charging,
+            reading.is_low_battery,
+        )
+        self.assertEqual(tuple(type(flag) for flag in flags), (bool, bool, bool))
+        self.assertIsInstance(reading.timestamp, int)
 
         # Check voltage is in reasonable range for simulated data
         self.assertGreaterEqual(reading.battery_voltage, 6.0)
@@ -71,13 +85,66 @@ class TestPiPowerMonitorDevelopment(unittest.TestCase):
 
     def test_health_check_development(self):
         """Test sensor health checking in development mode."""
-        # Should be healthy in development mode with simulated adapter
-        self.assertTrue(self.monitor.is_healthy())
+        monitor = self.fresh_monitor()
+        # Health follows readings, so a fresh monitor isn't healthy yet
+        self.assertFalse(monitor.is_healthy())
+        monitor.get_reading()
+        self.assertTrue(monitor.is_healthy())
+
+    def test_probe_health_reads_sensor(self):
+        """Test probe_health() actively reads the sensor."""
+        monitor = self.fresh_monitor()
+        self.assertTrue(monitor.probe_health())
+        with patch.object(monitor, "_read_status", side_effect=SensorReadError("boom")):
+            self.assertFalse(monitor.probe_health())
+        self.assertIsNone(monitor.get_last_reading())
+
+    def test_health_check_reuses_recent_reading(self):
+        """Test is_healthy() doesn't re-read the sensor right after a reading."""
+        monitor = self.fresh_monitor()
+        monitor.get_reading()
+        with patch.object(monitor, "_read_status") as mock_read:
+            self.assertTrue(monitor.is_healthy())
+            mock_read.assert_not_called()
+
+    def test_background_sampling(self):
+        """Test get_reading() serves the sampler thread's latest reading."""
+        config = {"pipower": dict(self.test_config["pipower"], sample_interval_s=0.01)}
+        monitor = PiPowerMonitor(config, production=False)
+        try:
+            self.assertTrue(wait_until(lambda: monitor._latest is not None))
+            with patch.object(monitor, "_read_status") as mock_read:
+                reading = monitor.get_reading()
+                mock_read.assert_not_called()
+            self.assertIsInstance(reading, PiPowerReading)
+            self.assertIs(monitor.get_last_reading(), reading)
+        finally:
+            monitor.cleanup()
+        self.assertIsNone(monitor._sampler)
+
+    def test_background_sample_error_raised_fresh(self):
+        """Test repeated sampler failures don't grow the stored traceback."""
+        config = {"pipower": dict(self.test_config["pipower"], sample_interval_s=0.01)}
+        monitor = PiPowerMonitor(config, production=False)
+        self.addCleanup(monitor.cleanup)
+        monitor._read_status = MagicMock(side_effect=OSError("bus error"))
+        self.assertTrue(wait_until(lambda: monitor._sample_error is not None))
+        # Stop the sampler but keep it attached, freezing the stored error
+        monitor._sampler_stop.set()
+        monitor._sampler.join()
+        error = monitor._sample_error
+        depth = len(traceback.extract_tb(error.__traceback__))
+
+        for _ in range(2):
+            with self.assertRaises(SensorReadError) as ctx:
+                monitor.get_reading()
+            self.assertIs(ctx.exception.__cause__, error)
+        self.assertEqual(len(traceback.extract_tb(error.__traceback__)), depth)
 
     def test_status_reporting_development(self):
         """Test status reporting functionality in development mode."""
-        self.monitor.get_reading()  # Take a reading first
-        status = self.monitor.get_status()
+        self.shared_monitor.get_reading()  # Take a reading first
+        status = self.shared_monitor.get_status()
 
         self.assertEqual(status["sensor_type"], "PiPowerV2")
         self.assertEqual(status["mode"], "development/simulated")
@@ -90,58 +157,63 @@ class TestPiPowerMonitorDevelopment(unittest.TestCase):
 
     def test_last_reading_retrieval_development(self):
         """Test retrieving the last reading in development mode."""
-        self.assertIsNone(self.monitor.get_last_reading())  # Initially None
-        reading1 = self.monitor.get_reading()
-        reading2 = self.monitor.get_last_reading()
+        monitor = self.fresh_monitor()
+        self.assertIsNone(monitor.get_last_reading())  # Initially None
+        reading1 = monitor.get_reading()
+        reading2 = monitor.get_last_reading()
         self.assertIsNotNone(reading2)
         self.assertEqual(reading1.timestamp, reading2.timestamp)
         self.assertEqual(reading1.battery_voltage, reading2.battery_voltage)
 
     def test_configuration_parsing(self):
-        """Test configuration parameter parsing."""
-        custom_config = {
-            "pipower": {
-                "log_readings": True,
-                "bt_lv_pin": 25,
-                "adc_channel": 1,
-                "in_dt_pin": 24,
-                "chg_pin": 23,
-                "lo_dt_pin": 22,
-            }
-        }
-        monitor = PiPowerMonitor(custom_config, production=False)
-        self.assertEqual(monitor.pins["BT_LV"], 25)
-        self.assertEqual(monitor.adc_channel, 1)
-        self.assertEqual(monitor.pins["IN_DT"], 24)
-        self.assertEqual(monitor.pins["CHG"], 23)
-        self.assertEqual(monitor.pins["LO_DT"], 22)
-        self.assertTrue(monitor.log_readings)
-
-    def test_missing_config_handling(self):
-        """Test handling of missing configuration values."""
-        monitor = PiPowerMonitor({}, production=False)  # Empty config
-        self.assertIsNone(monitor.pins["BT_LV"])
-        self.assertIsNone(monitor.adc_channel)
-        self.assertIsNone(monitor.pins["IN_DT"])
-        self.assertIsNone(monitor.pins["CHG"])
-        self.assertIsNone(monitor.pins["LO_DT"])
-        self.assertTrue(monitor.log_readings)  # Default should be True
+        """Test configuration parsing and handling of missing values."""
+        cases = [
+            (
+                {
+                    "pipower": {
+                        "log_readings": True,
+                        "bt_lv_pin": 25,
+                        "adc_channel": 1,
+                        "in_dt_pin": 24,
+                        "chg_pin": 23,
+                        "lo_dt_pin": 22,
+                    }
+                },
+                {
+                    "pins": {"BT_LV": 25, "IN_DT": 24, "CHG": 23, "LO_DT": 22},
+                    "adc_channel": 1,
+                    "log_readings": True,
+                },
+            ),
+            (
+                {},  # Empty config leaves the pins unset
+                {
+                    "pins": {"BT_LV": None, "IN_DT": None, "CHG": None, "LO_DT": None},
+                    "adc_channel": None,
+                    "log_readings": True,  # Default should be True
+                },
+            ),
+        ]
+        for config, expected in cases:
+            monitor = PiPowerMonitor(config, production=False)
+            for attr, value in expected.items():
+                with self.subTest(config=config, attr=attr):
+                    self.assertEqual(getattr(monitor, attr), value)
 
 
 class TestPiPowerMonitorProduction(unittest.TestCase):
     """Test cases for PiPower Monitor in Production Mode (Hardware)."""
 
-    def setUp(self):
-        self.test_config = {
-            "pipower": {
-                "log_readings": False,
-                "bt_lv_pin": 17,
-                "adc_channel": 0,
-                "in_dt_pin": 18,
-                "chg_pin": 27,
-                "lo_dt_pin": 22,
-            }
+    test_config = {
+        "pipower": {
+            "log_readings": False,
+            "bt_lv_pin": 17,
+            "adc_channel": 0,
+            "in_dt_pin": 18,
+            "chg_pin": 27,
+            "lo_dt_pin": 22,
         }
+    }
 
     @patch("sensors.pipower_monitor.GPIO")
     def test_production_mode_initialization_successful(self, mock_gpio):
@@ -165,16 +237,131 @@ class TestPiPowerMonitorProduction(unittest.TestCase):
         # Configure mock GPIO readings
         mock_gpio.HIGH = 1
         mock_gpio.LOW = 0
-        mock_gpio.input.side_effect = [1, 1, 0]  # USB power on, Charging, Battery OK
-
         monitor = PiPowerMonitor(self.test_config, production=True)
+
+        # Every IN_DT, CHG, LO_DT level combination against one monitor
+        for levels in itertools.product((0, 1), repeat=3):
+            with self.subTest(levels=levels):
+                mock_gpio.input.side_effect = list(levels)
+                reading = monitor.get_reading()
+
+                self.assertIsNotNone(reading)
+                self.assertEqual(
+                    (
+                        reading.is_usb_power_input,
+                        reading.is_charging,
+                        reading.is_low_battery,
+                    ),
+                    tuple(level == 1 for level in levels),
+                )
+                self.assertIsNone(reading.battery_voltage)  # No MCP3008 available
+
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_readings_gpiomem(self, mock_gpio):
+        """Test digital pins are decoded from one GPLEV0 register read."""
+        registers = bytearray(4096)
+        # GPLEV0 at 0x34: IN_DT (18) and LO_DT (22) high, CHG (27) low
+        registers[0x34:0x38] = ((1 << 18) | (1 << 22)).to_bytes(4, "little")
+        with patch.object(
+            HardwarePiPowerAdapter, "_open_gpiomem", return_value=registers
+        ):
+            monitor = PiPowerMonitor(self.test_config, production=True)
+
         reading = monitor.get_reading()
 
-        self.assertIsNotNone(reading)
-        self.assertTrue(reading.is_usb_power_input)  # First mock input was HIGH
-        self.assertTrue(reading.is_charging)  # Second mock input was HIGH
-        self.assertFalse(reading.is_low_battery)  # Third mock input was LOW
-        self.assertIsNone(reading.battery_voltage)  # No ADC implementation
+        self.assertTrue(reading.is_usb_power_input)
+        self.assertFalse(reading.is_charging)
+        self.assertTrue(reading.is_low_battery)
+        mock_gpio.input.assert_not_called()
+
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_readings_from_gpiod_edges(self, mock_gpio):
+        """Test digital pins follow gpiod edge events instead of being polled."""
+        mock_gpiod = MagicMock()
+        lines = mock_gpiod.Chip.return_value.get_lines.return_value
+        lines.get_values.return_value = [1, 0, 0]  # IN_DT, CHG, LO_DT
+
+        # Deliver one rising edge on CHG (27), then idle until cleanup
+        chg_line = MagicMock()
+        chg_line.offset.return_value = 27
+        chg_line.event_read.return_value.type = mock_gpiod.LineEvent.RISING_EDGE
+        delivered = threading.Event()
+
+        def event_wait(sec):
+            if delivered.is_set():
+                time.sleep(0.01)
+                return None
+            delivered.set()
+            return [chg_line]
+
+        lines.event_wait.side_effect = event_wait
+        with patch.dict(sys.modules, {"gpiod": mock_gpiod}):
+            monitor = PiPowerMonitor(self.test_config, production=True)
+        mock_gpiod.Chip.return_value.get_lines.assert_called_once_with([18, 27, 22])
+
+        adapter = monitor.sensor_adapter
+        self.assertTrue(wait_until(lambda: adapter._edge_levels == (True, True, False)))
+        reading = monitor.get_reading()
+        monitor.cleanup()
+
+        self.assertTrue(reading.is_usb_power_input)
+        self.assertTrue(reading.is_charging)
+        self.assertFalse(reading.is_low_battery)
+        mock_gpio.input.assert_not_called()
+        lines.release.assert_called_once()
+
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_battery_voltage_from_mcp3008(self, mock_gpio):
+        """Test BT_LV is read from the MCP3008 over spidev and scaled."""
+        mock_spidev = MagicMock()
+        spi = mock_spidev.SpiDev.return_value
+        spi.xfer2.return_value = [0x00, 0x02, 0x00]  # Raw 512 of 1023
+        with patch.dict(sys.modules, {"spidev": mock_spidev}):
+            monitor = PiPowerMonitor(self.test_config, production=True)
+
+        reading = monitor.get_reading()
+
+        spi.open.assert_called_once_with(0, 0)
+        spi.xfer2.assert_called_once_with(bytearray([1, 0x80, 0]))  # Channel 0
+        self.assertAlmostEqual(reading.battery_voltage, 512 * 3.3 / 1023 * 3.0)
+
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_adc_calibration_from_config(self, mock_gpio):
+        """Test adc_vref, adc_max and bt_lv_divider override the defaults."""
+        config = {
+            "pipower": dict(
+                self.test_config["pipower"],
+                adc_vref=5.0,
+                adc_max=1024,
+                bt_lv_divider=2.0,
+            )
+        }
+        mock_spidev = MagicMock()
+        mock_spidev.SpiDev.return_value.xfer2.return_value = [0x00, 0x02, 0x00]
+        with patch.dict(sys.modules, {"spidev": mock_spidev}):
+            monitor = PiPowerMonitor(config, production=True)
+
+        reading = monitor.get_reading()
+
+        self.assertAlmostEqual(reading.battery_voltage, 512 * 5.0 / 1024 * 2.0)
+
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_battery_voltage_from_pigpio(self, mock_gpio):
+        """Test use_pigpio reads the MCP3008 over pigpio bit-banged SPI."""
+        config = {"pipower": dict(self.test_config["pipower"], use_pigpio=True)}
+        mock_pigpio = MagicMock()
+        pi = mock_pigpio.pi.return_value
+        pi.bb_spi_xfer.return_value = (3, bytearray([0x00, 0x02, 0x00]))
+        with patch.dict(sys.modules, {"pigpio": mock_pigpio}):
+            monitor = PiPowerMonitor(config, production=True)
+
+        reading = monitor.get_reading()
+
+        pi.bb_spi_xfer.assert_called_once_with(8, bytes([1, 0x80, 0]))
+        self.assertAlmostEqual(reading.battery_voltage, 512 * 3.3 / 1023 * 3.0)
+        monitor.cleanup()
+        pi.bb_spi_close.assert_called_once_with(8)
+        pi.stop.assert_called_once()
 
     @patch("sensors.pipower_monitor.GPIO")
     def test_production_mode_gpio_error(self, mock_gpio):
@@ -184,6 +371,16 @@ class TestPiPowerMonitorProduction(unittest.TestCase):
         with self.assertRaises(SensorReadError):
             PiPowerMonitor(self.test_config, production=True)
 
+    @patch("sensors.pipower_monitor.GPIO")
+    def test_production_mode_read_error_wrapped(self, mock_gpio):
+        """Test driver errors surface from get_reading() as SensorReadError."""
+        monitor = PiPowerMonitor(self.test_config, production=True)
+        mock_gpio.input.side_effect = RuntimeError("GPIO read failed")
+
+        with self.assertRaises(SensorReadError) as ctx:
+            monitor.get_reading()
+        self.assertIsInstance(ctx.exception.__cause__, RuntimeError)
+
     @patch("sensors.pipower_monitor.GPIO")
     def test_cleanup(self, mock_gpio):
         """Test cleanup in production mode."""
@@ -196,11 +393,11 @@ class TestPiPowerMonitorProduction(unittest.TestCase):
 class TestPiPowerReadingDataClass(unittest.TestCase):
     """Test cases for PiPowerReading data class."""
 
+    TIMESTAMP_NS = 1_700_000_000_000_000_000
+
     def test_power_reading_creation(self):
         """Test PiPowerReading data class creation and attributes."""
-        import time
-
-        timestamp = time.time()
+        timestamp = self.TIMESTAMP_NS
         reading = PiPowerReading(
             battery_voltage=7.4,
             is_usb_power_input=True,
@@ -222,7 +419,7 @@ class TestPiPowerReadingDataClass(unittest.TestCase):
             is_usb_power_input=True,
             is_charging=False,
             is_low_battery=False,
-            timestamp=time.time(),
+            timestamp=self.TIMESTAMP_NS,
         )
         self.assertIsNone(reading.battery_voltage)
 